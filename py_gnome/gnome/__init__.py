@@ -113,14 +113,35 @@ def _valid_units(unit_name):
 
 
 # we have a sort of chicken-egg situation here.  The above functions need
-# to be defined before we can import these modules.
+# to be defined before the sub-packages are imported.
 check_dependency_versions()
 
-from . import (environment,
-               model,
-               # multi_model_broadcast,
-               spill,
-               movers,
-               outputters)
 
-from .maps import map
+def __getattr__(name):
+    """
+    Import gnome sub-packages the first time they are accessed.
+
+    ``gnome.model``, ``gnome.outputters``, etc used to be imported here, so
+    that they are always in the namespace. That pulls in netCDF4, PIL,
+    shapely, etc. for any use of gnome at all, so instead they are imported
+    on first access (PEP 562).
+    """
+    if name.startswith('__'):
+        raise AttributeError("module {!r} has no attribute {!r}"
+                             .format(__name__, name))
+
+    # gnome.map is the old name for gnome.maps.map
+    modname = 'gnome.maps.map' if name == 'map' else 'gnome.' + name
+
+    try:
+        module = importlib.import_module(modname)
+    except ModuleNotFoundError as err:
+        if err.name != modname:
+            raise
+
+        raise AttributeError("module {!r} has no attribute {!r}"
+                             .format(__name__, name))
+
+    globals()[name] = module
+
+    return module
@@ -4,11 +4,10 @@
 
 
 
-from future.utils import with_metaclass
-from past.types import basestring
 
 import os
 import copy
+import importlib
 import logging
 import glob
 import json
@@ -35,12 +34,31 @@ def class_from_objtype(obj_type):
     object type must be a string in the gnome namespace:
         gnome.xxx.xxx
     '''
-    if len(obj_type.split('.')) == 1:
+    parts = obj_type.split('.')
+
+    if len(parts) == 1:
         return
 
+    # import the longest module path in obj_type -- gnome imports its
+    # sub-packages lazily, so they may not be loaded yet.
+    module, i = gnome, 1
+
+    if parts[0] == 'gnome':
+        for j in range(len(parts) - 1, 1, -1):
+            modname = '.'.join(parts[:j])
+
+            try:
+                module, i = importlib.import_module(modname), j
+                break
+            except ModuleNotFoundError as err:
+                # a missing dependency of the module, not a class name
+                missing = (err.name or '') + '.'
+                if not (modname + '.').startswith(missing):
+                    raise
+
     try:
-        # call getattr recursively
-        return reduce(getattr, obj_type.split('.')[1:], gnome)
+        # call getattr recursively for the class, or nested class
+        return reduce(getattr, parts[i:], module)
     except AttributeError:
         log.warning("{0} is not part of gnome namespace".format(obj_type))
         raise
@@ -138,9 +156,7 @@ class GnomeObjMeta(type):
         return super(GnomeObjMeta, cls).__new__(cls, name, parents, dct)
 
 
-class GnomeId(with_metaclass(GnomeObjMeta, AddLogger)):
-# py3 way, when we get there
-# class GnomeId(AddLogger, metaclass=GnomeObjMeta):
+class GnomeId(AddLogger, metaclass=GnomeObjMeta):
     '''
     A class for assigning a unique ID for an object
     '''
@@ -152,7 +168,7 @@ class GnomeId(with_metaclass(GnomeObjMeta, AddLogger)):
         self.__class__._instance_count += 1
 
         if name:
-            if isinstance(name, basestring) and '/' in name or '\\' in name:
+            if isinstance(name, str) and '/' in name or '\\' in name:
                 raise ValueError("Invalid slash character in object name: {0}".format(name))
             self.name = name
         self._appearance = _appearance
@@ -757,7 +773,7 @@ class GnomeId(with_metaclass(GnomeObjMeta, AddLogger)):
         if not refs:
             refs = Refs()
 
-        if isinstance(saveloc, basestring):
+        if isinstance(saveloc, str):
             if os.path.isdir(saveloc):
                 #run the savefile update system
                 if apply_update_patches:
@@ -5,7 +5,6 @@
 
 
 
-from past.types import basestring
 
 import os
 from datetime import datetime, timedelta
@@ -625,7 +624,7 @@ class Model(GnomeId):
         items = []
         for item in collection:
             try:
-                if not isinstance(getattr(item, attr), basestring):
+                if not isinstance(getattr(item, attr), str):
                     if any([value == v for v in getattr(item, attr)]):
                         if allitems:
                             items.append(item)
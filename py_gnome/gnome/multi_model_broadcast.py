@@ -2,7 +2,6 @@
 
 
 
-from future.utils import reraise
 
 import sys
 import os
@@ -338,7 +337,7 @@ class ModelBroadcaster(GnomeId):
                 isinstance(response[1], Exception) and
                 isinstance(response[2], traceback.types.TracebackType)):
             self.stop()
-            reraise(*response)
+            raise response[1].with_traceback(response[2])
 
     def stop(self):
         if hasattr(self, 'tasks') and len(self.tasks) > 0:
@@ -2,7 +2,6 @@
 
 
 
-from past.types import basestring
 
 
 # import pdb
@@ -141,7 +140,7 @@ class ObjType(SchemaType):
 #                     if d in dict_:
 #                         if dict_[d] is None:
 #                             continue
-#                         elif isinstance(dict_[d], basestring):
+#                         elif isinstance(dict_[d], str):
 #                             dict_[d] = os.path.split(dict_[d])[1]
 #                         elif isinstance(dict_[d], collections.Iterable):
 #                             #List, tuple, etc
@@ -341,7 +340,7 @@ class ObjType(SchemaType):
         for d in datafiles:
             if json_[d] is None:
                 continue
-            elif isinstance(json_[d], basestring):
+            elif isinstance(json_[d], str):
                 json_[d] = self._process_supporting_file(json_[d], zipfile_)
             elif isinstance(json_[d], collections.Iterable):
                 # List, tuple, etc
@@ -496,7 +495,7 @@ class ObjType(SchemaType):
             tmpdir = tempfile.mkdtemp()
 
         for d in datafiles:
-            if isinstance(cstruct[d], basestring):
+            if isinstance(cstruct[d], str):
                 cstruct[d] = self._load_supporting_file(cstruct[d],
                                                         saveloc, tmpdir)
                 log.info('Extracted file {0}'.format(cstruct[d]))
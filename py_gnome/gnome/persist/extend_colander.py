@@ -6,7 +6,6 @@ of gnome specific types
 
 
 
-from past.types import basestring
 
 import datetime
 import os
@@ -209,7 +208,7 @@ class TimeDelta(Float):
 #         return rv
 #
 #     def deserialize(self, node, cstruct):
-#         if isinstance(cstruct, basestring):
+#         if isinstance(cstruct, str):
 #             return cstruct
 #         else:
 #             return super(Filename, self).deserialize(node, cstruct)
@@ -219,7 +218,7 @@ class OrderedCollectionType(Sequence):
     #identical to SequenceSchema except it can tolerate a 'get'
     def _validate(self, node, value, accept_scalar):
         if (hasattr(value, '__iter__') and
-            not isinstance(value, basestring)):
+            not isinstance(value, str)):
             return list(value)
         if accept_scalar:
             return [value]
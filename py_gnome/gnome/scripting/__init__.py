@@ -33,20 +33,15 @@
 
 
 
-# import gnome
-
-from gnome.model import Model
-
-from gnome.basic_types import oil_status_map
-
-from .utilities import (make_images_dir,
-                        remove_netcdf,
-                        set_verbose,
-                        PrintFinder,
-                        )
+import sys
+import types
+import importlib
+import threading
 
-from gnome.utilities.time_utils import asdatetime
+# import gnome
 
+# These are cheap to import, and used in nearly every script, so they are
+# always loaded.
 from .time_utils import (seconds,
                          minutes,
                          hours,
@@ -54,50 +49,154 @@ from .time_utils import (seconds,
                          weeks,
                          now,
                          )
+from gnome.utilities.time_utils import asdatetime
 from gnome.utilities.inf_datetime import MinusInfTime, InfTime
 
+from gnome.basic_types import oil_status_map
+
 
-from gnome.spill.spill import (point_line_release_spill,
-                               surface_point_line_spill,
-                               subsurface_plume_spill,
-                               grid_spill,
-                               spatial_release_spill,
-                               )
-
-from gnome.environment.wind import Wind, constant_wind
-from gnome.movers.wind_movers import (constant_wind_mover,
-                                      wind_mover_from_file,
-                                      )
-
-from gnome.outputters import (Renderer,
-                              NetCDFOutput,
-                              KMZOutput,
-                              OilBudgetOutput,
-                              ShapeOutput,
-                              WeatheringOutput,
-                              )
-
-from gnome.maps.map import MapFromBNA, GnomeMap
-
-from gnome.environment import (GridCurrent,
-                               GridWind,
-                               IceAwareCurrent,
-                               IceAwareWind,
-                               Tide,
-                               Water,
-                               Waves,
-                               )
-
-from gnome.movers import (RandomMover,
-                          RandomMover3D,
-                          WindMover,
-                          CatsMover,
-                          ComponentMover,
-                          RiseVelocityMover,
-                          PyWindMover,
-                          PyCurrentMover,
-                          IceAwareRandomMover,
-                          SimpleMover,
-                          )
-
-from gnome.utilities.remote_data import get_datafile
+# The rest of the public names are resolved on first access (PEP 562), so
+# that importing gnome.scripting does not pull in the model, the outputters
+# (netCDF4, PIL, ...), maps, movers and environment objects until they are
+# actually used.
+#
+# name: (module, attribute)
+_LAZY = types.MappingProxyType({
+    'make_images_dir': ('gnome.scripting.utilities', 'make_images_dir'),
+    'remove_netcdf': ('gnome.scripting.utilities', 'remove_netcdf'),
+    'set_verbose': ('gnome.scripting.utilities', 'set_verbose'),
+    'PrintFinder': ('gnome.scripting.utilities', 'PrintFinder'),
+    'cached_constant_wind': ('gnome.scripting.utilities',
+                             'cached_constant_wind'),
+    'cached_constant_wind_mover': ('gnome.scripting.utilities',
+                                   'cached_constant_wind_mover'),
+    'cached_water': ('gnome.scripting.utilities', 'cached_water'),
+    'clear_factory_caches': ('gnome.scripting.utilities',
+                             'clear_factory_caches'),
+
+    'get_datafile': ('gnome.scripting.utilities', 'get_datafile'),
+    'clear_datafile_cache': ('gnome.utilities.remote_data',
+                             'clear_datafile_cache'),
+
+    'Model': ('gnome.model', 'Model'),
+
+    'point_line_release_spill': ('gnome.spill.spill',
+                                 'point_line_release_spill'),
+    'surface_point_line_spill': ('gnome.spill.spill',
+                                 'surface_point_line_spill'),
+    'subsurface_plume_spill': ('gnome.spill.spill',
+                               'subsurface_plume_spill'),
+    'grid_spill': ('gnome.spill.spill', 'grid_spill'),
+    'spatial_release_spill': ('gnome.spill.spill',
+                              'spatial_release_spill'),
+
+    'Wind': ('gnome.environment.wind', 'Wind'),
+    'constant_wind': ('gnome.environment.wind', 'constant_wind'),
+    'constant_wind_mover': ('gnome.movers.wind_movers',
+                            'constant_wind_mover'),
+    'wind_mover_from_file': ('gnome.movers.wind_movers',
+                             'wind_mover_from_file'),
+
+    'Renderer': ('gnome.outputters', 'Renderer'),
+    'NetCDFOutput': ('gnome.outputters', 'NetCDFOutput'),
+    'KMZOutput': ('gnome.outputters', 'KMZOutput'),
+    'OilBudgetOutput': ('gnome.outputters', 'OilBudgetOutput'),
+    'ShapeOutput': ('gnome.outputters', 'ShapeOutput'),
+    'WeatheringOutput': ('gnome.outputters', 'WeatheringOutput'),
+
+    'MapFromBNA': ('gnome.maps.map', 'MapFromBNA'),
+    'GnomeMap': ('gnome.maps.map', 'GnomeMap'),
+
+    'GridCurrent': ('gnome.environment', 'GridCurrent'),
+    'GridWind': ('gnome.environment', 'GridWind'),
+    'IceAwareCurrent': ('gnome.environment', 'IceAwareCurrent'),
+    'IceAwareWind': ('gnome.environment', 'IceAwareWind'),
+    'Tide': ('gnome.environment', 'Tide'),
+    'Water': ('gnome.environment', 'Water'),
+    'Waves': ('gnome.environment', 'Waves'),
+
+    'RandomMover': ('gnome.movers', 'RandomMover'),
+    'RandomMover3D': ('gnome.movers', 'RandomMover3D'),
+    'WindMover': ('gnome.movers', 'WindMover'),
+    'CatsMover': ('gnome.movers', 'CatsMover'),
+    'ComponentMover': ('gnome.movers', 'ComponentMover'),
+    'RiseVelocityMover': ('gnome.movers', 'RiseVelocityMover'),
+    'PyWindMover': ('gnome.movers', 'PyWindMover'),
+    'PyCurrentMover': ('gnome.movers', 'PyCurrentMover'),
+    'IceAwareRandomMover': ('gnome.movers', 'IceAwareRandomMover'),
+    'SimpleMover': ('gnome.movers', 'SimpleMover'),
+})
+
+__all__ = ('seconds',
+           'minutes',
+           'hours',
+           'days',
+           'weeks',
+           'now',
+           'asdatetime',
+           'MinusInfTime',
+           'InfTime',
+           'oil_status_map',
+           'warm_up',
+           'warm_up_async',
+           ) + tuple(_LAZY)
+
+# the lazy names that have been imported so far -- handy for debugging
+_RESOLVED = set()
+
+_MISSING = object()
+
+
+def __getattr__(name):
+    """
+    Import a lazily loaded name the first time it is accessed.
+
+    The result is stored in the module namespace, so later lookups
+    find it there as a regular attribute, and never get here.
+    """
+    target = _LAZY.get(name, _MISSING)
+
+    if target is _MISSING:
+        raise AttributeError("module {!r} has no attribute {!r}"
+                             .format(__name__, name))
+
+    modname, attr = target
+    obj = getattr(importlib.import_module(modname), attr)
+    globals()[name] = obj
+    _RESOLVED.add(name)
+
+    return obj
+
+
+def __dir__():
+    return sorted(__all__)
+
+
+def warm_up(names=None):
+    """
+    Import the lazily loaded names now, rather than on first use.
+
+    Useful if you'd rather pay the import cost up front than in the middle
+    of a model run.
+
+    :param names=None: the names to import. Default is all of them.
+    """
+    module = sys.modules[__name__]
+
+    for name in (__all__ if names is None else names):
+        getattr(module, name)
+
+
+def warm_up_async(names=None):
+    """
+    Run warm_up() in a background thread, so the imports can overlap with
+    other setup (reading files, etc.)
+
+    :param names=None: the names to import. Default is all of them.
+
+    :returns: the (daemon) thread, in case you want to join() it.
+    """
+    thread = threading.Thread(target=warm_up, args=(names,), daemon=True)
+    thread.start()
+
+    return thread
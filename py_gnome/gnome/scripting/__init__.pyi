@@ -0,0 +1,87 @@
+"""
+Type stub for gnome.scripting
+
+Most of the names in gnome.scripting are imported lazily, on first
+access (see __init__.py). This stub lists them all, so that IDEs and
+type checkers can see the whole namespace without importing it.
+"""
+
+import threading
+from typing import Iterable, Optional, Tuple
+
+from .time_utils import (seconds as seconds,
+                         minutes as minutes,
+                         hours as hours,
+                         days as days,
+                         weeks as weeks,
+                         now as now,
+                         )
+from gnome.utilities.time_utils import asdatetime as asdatetime
+from gnome.utilities.inf_datetime import (MinusInfTime as MinusInfTime,
+                                          InfTime as InfTime,
+                                          )
+from gnome.basic_types import oil_status_map as oil_status_map
+
+from .utilities import (make_images_dir as make_images_dir,
+                        remove_netcdf as remove_netcdf,
+                        set_verbose as set_verbose,
+                        PrintFinder as PrintFinder,
+                        cached_constant_wind as cached_constant_wind,
+                        cached_constant_wind_mover as cached_constant_wind_mover,
+                        cached_water as cached_water,
+                        clear_factory_caches as clear_factory_caches,
+                        get_datafile as get_datafile,
+                        )
+from gnome.utilities.remote_data import (clear_datafile_cache as clear_datafile_cache,
+                                         )
+from gnome.model import Model as Model
+from gnome.spill.spill import (point_line_release_spill as point_line_release_spill,
+                               surface_point_line_spill as surface_point_line_spill,
+                               subsurface_plume_spill as subsurface_plume_spill,
+                               grid_spill as grid_spill,
+                               spatial_release_spill as spatial_release_spill,
+                               )
+from gnome.environment.wind import (Wind as Wind,
+                                    constant_wind as constant_wind,
+                                    )
+from gnome.movers.wind_movers import (constant_wind_mover as constant_wind_mover,
+                                      wind_mover_from_file as wind_mover_from_file,
+                                      )
+from gnome.outputters import (Renderer as Renderer,
+                              NetCDFOutput as NetCDFOutput,
+                              KMZOutput as KMZOutput,
+                              OilBudgetOutput as OilBudgetOutput,
+                              ShapeOutput as ShapeOutput,
+                              WeatheringOutput as WeatheringOutput,
+                              )
+from gnome.maps.map import (MapFromBNA as MapFromBNA,
+                            GnomeMap as GnomeMap,
+                            )
+from gnome.environment import (GridCurrent as GridCurrent,
+                               GridWind as GridWind,
+                               IceAwareCurrent as IceAwareCurrent,
+                               IceAwareWind as IceAwareWind,
+                               Tide as Tide,
+                               Water as Water,
+                               Waves as Waves,
+                               )
+from gnome.movers import (RandomMover as RandomMover,
+                          RandomMover3D as RandomMover3D,
+                          WindMover as WindMover,
+                          CatsMover as CatsMover,
+                          ComponentMover as ComponentMover,
+                          RiseVelocityMover as RiseVelocityMover,
+                          PyWindMover as PyWindMover,
+                          PyCurrentMover as PyCurrentMover,
+                          IceAwareRandomMover as IceAwareRandomMover,
+                          SimpleMover as SimpleMover,
+                          )
+
+__all__: Tuple[str, ...]
+
+
+def warm_up(names: Optional[Iterable[str]] = ...) -> None: ...
+
+
+def warm_up_async(names: Optional[Iterable[str]] = ...
+                  ) -> threading.Thread: ...
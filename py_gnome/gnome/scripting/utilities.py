@@ -16,8 +16,11 @@ import os
 import sys
 import traceback
 import shutil
+import importlib
+import functools
 
 import gnome
+from gnome.utilities import remote_data
 
 
 def make_images_dir(images_dir=None):
@@ -119,3 +122,91 @@ class PrintFinder(object):
         forwards a flush call on to the original stdout
         """
         self.stdout.flush()
+
+
+# Memoized versions of some of the commonly used factories.
+#
+# These are for scripts that build the same objects over and over
+# (parameter sweeps, etc). The returned objects are shared between calls,
+# so they should be treated as immutable -- if you need to change one,
+# use the regular (uncached) version.
+
+def _quantize(value):
+    """
+    round floats so that floating point noise doesn't cause cache misses
+    """
+    return round(value, 9) if isinstance(value, float) else value
+
+
+@functools.lru_cache(maxsize=256)
+def _cached_factory(modname, name, args, kwargs):
+    factory = getattr(importlib.import_module(modname), name)
+
+    return factory(*args, **dict(kwargs))
+
+
+def _call_cached(modname, name, args, kwargs):
+    args = tuple(_quantize(a) for a in args)
+    kwargs = tuple(sorted((k, _quantize(v)) for k, v in kwargs.items()))
+
+    try:
+        hash((args, kwargs))
+    except TypeError:
+        # unhashable arguments (arrays, dicts) -- nothing to cache on.
+        factory = getattr(importlib.import_module(modname), name)
+
+        return factory(*args, **dict(kwargs))
+
+    return _cached_factory(modname, name, args, kwargs)
+
+
+def cached_constant_wind(*args, **kwargs):
+    """
+    Same as ``constant_wind``, but returns the same Wind object
+    for repeated calls with the same arguments.
+
+    The returned object is shared -- do not modify it.
+    """
+    return _call_cached('gnome.environment.wind', 'constant_wind',
+                        args, kwargs)
+
+
+def cached_constant_wind_mover(*args, **kwargs):
+    """
+    Same as ``constant_wind_mover``, but returns the same WindMover object
+    for repeated calls with the same arguments.
+
+    The returned object is shared -- do not modify it.
+    """
+    return _call_cached('gnome.movers.wind_movers', 'constant_wind_mover',
+                        args, kwargs)
+
+
+def cached_water(*args, **kwargs):
+    """
+    Same as ``Water``, but returns the same Water object
+    for repeated calls with the same arguments.
+
+    The returned object is shared -- do not modify it.
+    """
+    return _call_cached('gnome.environment', 'Water', args, kwargs)
+
+
+def clear_factory_caches():
+    """
+    Clear the cache used by the cached_* factories
+    """
+    _cached_factory.cache_clear()
+
+
+def get_datafile(filename, cache='if-missing'):
+    """
+    Same as ``gnome.utilities.remote_data.get_datafile``, but downloads are
+    kept in the data file cache by default, so running a script again
+    doesn't download its input files again.
+
+    Use cache='revalidate' to check with the server that the cached file
+    is still current, or cache=None to not use the cache. Clear the cache
+    with ``clear_datafile_cache()``.
+    """
+    return remote_data.get_datafile(filename, cache=cache)
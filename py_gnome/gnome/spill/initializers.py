@@ -156,8 +156,8 @@ class InitMassFromPlume(InitBaseClass):
             raise ValueError('plume_gen attribute of spill is None - cannot'
                              ' compute mass without plume mass flux')
 
-        data_arrays['mass'][-num_new_particles:] = \
-            substance.plume_gen.mass_of_an_le * 1000
+        data_arrays['mass'][-num_new_particles:].fill(
+            substance.plume_gen.mass_of_an_le * 1000)
 
 
 class DistributionBaseSchema(base_schema.ObjTypeSchema):
@@ -10,9 +10,12 @@ is composed of a release object and an ElementType
 
 import copy
 import functools
+import itertools
 import math
+import re
 import warnings
 import numpy as np
+from numpy.lib.recfunctions import structured_to_unstructured
 import shapefile as shp
 # import trimesh # making this optional
 import geojson
@@ -29,6 +32,7 @@ from pyproj import Proj, transform
 import pyproj
 
 from gnome.utilities.time_utils import asdatetime
+from gnome.utilities.rand import build_alias_table, alias_sample
 import gnome.utilities.geometry.geo_routines as geo_routines
 
 
@@ -43,7 +47,6 @@ from gnome.basic_types import world_point_type
 from gnome.array_types import gat
 from gnome.utilities.plume import Plume, PlumeGenerator
 
-from gnome.outputters import NetCDFOutput
 from gnome.gnomeobject import GnomeId
 from gnome.environment.timeseries_objects_base import (TimeseriesData,
                                                        TimeseriesVector)
@@ -135,6 +138,7 @@ class Release(GnomeId):
         :type release_mass: integer
         """
         self._num_elements = self._num_per_timestep = None
+        self._end_release_time = None
 
         if num_elements is None and num_per_timestep is None:
             num_elements = 1000
@@ -166,8 +170,12 @@ class Release(GnomeId):
     def rewind(self):
         self._prepared = False
         self._mass_per_le = 0
+        self._num_ts_cache = {}
         self._release_ts = None
+        self._release_secs = None
+        self._release_data = None
         self._pos_ts = None
+        self._cp_arr = None
 
     @property
     def centroid(self):
@@ -175,6 +183,16 @@ class Release(GnomeId):
             mp = shapely.geometry.MultiPoint(self.custom_positions)
             return np.array((mp.centroid.x, mp.centroid.y, 0))
 
+    @property
+    def custom_positions(self):
+        return self._custom_positions
+
+    @custom_positions.setter
+    def custom_positions(self, val):
+        self._custom_positions = val
+        # array version, made when it's needed
+        self._cp_arr = None
+
     @property
     def release_mass(self):
         return self._release_mass
@@ -227,15 +245,31 @@ class Release(GnomeId):
         if val is not None:
             self._num_per_timestep = None
 
+    @property
+    def release_time(self):
+        return self._release_time
+
+    @release_time.setter
+    def release_time(self, val):
+        self._release_time = val
+        self._update_release_duration()
+
     @property
     def release_duration(self):
         '''
         duration over which particles are released in seconds
         '''
-        if self.end_release_time is None:
-            return 0
+        return self._release_duration
+
+    def _update_release_duration(self):
+        # release_duration is computed when the times are set, not every
+        # time it's asked for
+        self._num_ts_cache = {}
+        if self._end_release_time is None:
+            self._release_duration = 0
         else:
-            return (self.end_release_time - self.release_time).total_seconds()
+            self._release_duration = (self._end_release_time -
+                                      self.release_time).total_seconds()
 
     @property
     def end_release_time(self):
@@ -261,6 +295,7 @@ class Release(GnomeId):
                              'release_time')
 
         self._end_release_time = val
+        self._update_release_duration()
 
     def LE_timestep_ratio(self, ts):
         '''
@@ -280,10 +315,19 @@ class Release(GnomeId):
     def get_num_release_time_steps(self, ts):
         '''
         calculates how many time steps it takes to complete the release duration
+
+        The result is cached per ts; the cache is cleared when the release
+        times are changed, and on rewind.
         '''
+        try:
+            return self._num_ts_cache[ts]
+        except KeyError:
+            pass
+
         rts = int(ceil(self.release_duration / ts))
         if rts == 0:
             rts = 1
+        self._num_ts_cache[ts] = rts
         return rts
 
     def generate_release_timeseries(self, num_ts, max_release, ts):
@@ -315,6 +359,11 @@ class Release(GnomeId):
                                               time=t,
                                               data=np.linspace(0, max_release, num_ts + 1).astype(int))
 
+        # plain arrays for num_elements_after_time()
+        self._release_secs = np.array([(dt - self.release_time).total_seconds()
+                                       for dt in t.data])
+        self._release_data = self._release_ts.data
+
     def num_elements_after_time(self, current_time, time_step):
         '''
         Returns the number of elements expected to exist at current_time+time_step.
@@ -326,7 +375,21 @@ class Release(GnomeId):
             return 0
         if current_time < self.release_time:
             return 0
-        return int(math.ceil(self._release_ts.at(None, current_time + timedelta(seconds=time_step), extrapolate=True)))
+
+        # the same as self._release_ts.at(None, time, extrapolate=True), but
+        # without the TimeseriesData overhead. The interpolation is done the
+        # same way, so values that land on integers aren't rounded up by ceil
+        secs = (current_time - self.release_time).total_seconds() + time_step
+        knots = self._release_secs
+        data = self._release_data
+        if secs > knots[-1]:
+            return int(data[-1])
+        if secs <= knots[0]:
+            return int(data[0])
+
+        i = knots.searchsorted(secs)
+        alpha = (secs - knots[i - 1]) / (knots[i] - knots[i - 1])
+        return int(math.ceil(data[i - 1] + (data[i] - data[i - 1]) * alpha))
 
     def prepare_for_model_run(self, ts):
         '''
@@ -348,6 +411,10 @@ class Release(GnomeId):
         self.generate_release_timeseries(num_ts, max_release, ts)
         self._mass_per_le = self.release_mass*1.0 / max_release
 
+        if self.custom_positions is not None:
+            self._cp_arr = np.asarray(self.custom_positions,
+                                      dtype=world_point_type).reshape((-1, 3))
+
         if self.__class__ is Release:
             self._prepared = True
 
@@ -364,18 +431,28 @@ class Release(GnomeId):
         if to_rel < num_locs:
             warnings.warn("{0} is releasing fewer LEs than number of start positions at time: {1}".format(self, current_time))
 
+        if self._cp_arr is None:
+            self._cp_arr = np.asarray(self.custom_positions,
+                                      dtype=world_point_type).reshape((-1, 3))
+
         sl = slice(-to_rel, None, 1)
         qt = to_rel // num_locs #number of times to tile self.start_positions
         rem = to_rel % num_locs #remaining LES to distribute randomly
-        qt_pos = np.tile(self.custom_positions, (qt, 1))
-        rem_pos = self.custom_positions[np.random.randint(0,len(self.custom_positions), rem)]
-        pos = np.vstack((qt_pos, rem_pos))
-        assert len(pos) == to_rel
-        data['positions'][sl] = pos
+
+        # fill the positions in place, rather than building a new array
+        pos = data['positions'][sl]
+        if qt:
+            if pos.flags.c_contiguous:
+                # reshape is a view, so this broadcasts into data['positions']
+                pos[:qt * num_locs].reshape((qt, num_locs, 3))[:] = self._cp_arr
+            else:
+                pos[:qt * num_locs] = np.tile(self._cp_arr, (qt, 1))
+        if rem:
+            pos[qt * num_locs:] = self._cp_arr[np.random.randint(0, num_locs, rem)]
 
 
-        data['mass'][sl] = self._mass_per_le
-        data['init_mass'][sl] = self._mass_per_le
+        data['mass'][sl].fill(self._mass_per_le)
+        data['init_mass'][sl].fill(self._mass_per_le)
 
 
 
@@ -438,6 +515,7 @@ class PointLineRelease(Release):
 
         # initializes internal variables: _end_release_time, _start_position,
         # _end_position
+        self._end_position = None
         self.start_position = start_position
         self.end_position = end_position
 
@@ -458,13 +536,14 @@ class PointLineRelease(Release):
 
         :returns: True if point source, false otherwise
         '''
-        if self.end_position is None:
-            return True
+        return self._is_pointsource
 
-        if np.all(self.end_position == self.start_position):
-            return True
-
-        return False
+    def _update_pointsource(self):
+        # called by the position setters, so is_pointsource doesn't need
+        # to compare the arrays every time
+        self._is_pointsource = (self._end_position is None or
+                                np.array_equal(self._end_position,
+                                               self._start_position))
 
     @property
     def centroid(self):
@@ -482,6 +561,7 @@ class PointLineRelease(Release):
         '''
         self._start_position = np.array(val,
                                         dtype=world_point_type).reshape((3, ))
+        self._update_pointsource()
 
     @property
     def end_position(self):
@@ -503,6 +583,7 @@ class PointLineRelease(Release):
             val = np.array(val, dtype=world_point_type).reshape((3, ))
 
         self._end_position = val
+        self._update_pointsource()
 
     def generate_release_timeseries(self, num_ts, max_release, ts):
         '''
@@ -513,24 +594,53 @@ class PointLineRelease(Release):
         '''
         super(PointLineRelease, self).generate_release_timeseries(num_ts, max_release, ts)
         t = self._release_ts.time
-        lon_ts = TimeseriesData(name=self.name+'_lon_ts',
-                                time=t,
-                                data=np.linspace(self.start_position[0], self.end_position[0], num_ts + 1))
-        lat_ts = TimeseriesData(name=self.name+'_lat_ts',
-                                time=t,
-                                data=np.linspace(self.start_position[1], self.end_position[1], num_ts + 1))
-        z_ts = TimeseriesData(name=self.name+'_z_ts',
-                                time=t,
-                                data=np.linspace(self.start_position[2], self.end_position[2], num_ts + 1))
+        # one (num_ts + 1, 3) ramp, kept for _positions_at(); the
+        # TimeseriesData get column views of it
+        self._pos_arr = np.linspace(np.asarray(self.start_position, dtype=np.float64),
+                                    np.asarray(self.end_position, dtype=np.float64),
+                                    num_ts + 1, axis=0)
+        lon_ts, lat_ts, z_ts = (TimeseriesData(name=self.name + suffix,
+                                               time=t,
+                                               data=self._pos_arr[:, i])
+                                for i, suffix in enumerate(('_lon_ts',
+                                                            '_lat_ts',
+                                                            '_z_ts')))
         self._pos_ts = TimeseriesVector(name=self.name+'_pos_ts',
                                         time=t,
                                         variables=[lon_ts, lat_ts, z_ts])
 
+        self._pos_secs = self._release_secs
+
+    def _positions_at(self, secs):
+        '''
+        Positions of the source at the given times -- the same as
+        self._pos_ts.at(None, time, extrapolate=True), for an array of times
+
+        :param secs: array of times, in seconds since release_time
+        :return: (len(secs), 3) array of positions
+        '''
+        knots = self._pos_secs
+        secs = np.clip(secs, knots[0], knots[-1])
+
+        i = np.clip(np.searchsorted(knots, secs), 1, len(knots) - 1)
+        alpha = (secs - knots[i - 1]) / (knots[i] - knots[i - 1])
+
+        p0 = self._pos_arr[i - 1]
+        p1 = self._pos_arr[i]
+        pos = p0 + (p1 - p0) * alpha[:, None]
+
+        return np.where((secs >= knots[-1])[:, None], self._pos_arr[-1], pos)
+
     def rewind(self):
         self._prepared = False
         self._mass_per_le = 0
+        self._num_ts_cache = {}
         self._release_ts = None
+        self._release_secs = None
+        self._release_data = None
         self._pos_ts = None
+        self._pos_arr = None
+        self._pos_secs = None
 
     def prepare_for_model_run(self, ts):
         super(PointLineRelease, self).prepare_for_model_run(ts)
@@ -546,22 +656,14 @@ class PointLineRelease(Release):
             time_step = 1 #to deal with initializing position in instantaneous release case
 
         sl = slice(-to_rel, None, 1)
-        start_position = self._pos_ts.at(None, current_time, extrapolate=True)
-        end_position = self._pos_ts.at(None, current_time + timedelta(seconds=time_step), extrapolate=True)
-        data['positions'][sl, 0] = \
-            np.linspace(start_position[0],
-                        end_position[0],
-                        to_rel)
-        data['positions'][sl, 1] = \
-            np.linspace(start_position[1],
-                        end_position[1],
-                        to_rel)
-        data['positions'][sl, 2] = \
-            np.linspace(start_position[2],
-                        end_position[2],
-                        to_rel)
-        data['mass'][sl] = self._mass_per_le
-        data['init_mass'][sl] = self._mass_per_le
+        t = (current_time - self.release_time).total_seconds()
+        start_position, end_position = self._positions_at(np.array([t, t + time_step]))
+
+        # spread the new LEs along the line the source moved over this step
+        data['positions'][sl] = np.linspace(start_position, end_position, to_rel)
+
+        data['mass'][sl].fill(self._mass_per_le)
+        data['init_mass'][sl].fill(self._mass_per_le)
 
 class SpatialReleaseSchema(BaseReleaseSchema):
     filename = FilenameSchema(save=False, update=False, test_equal=False, missing=drop)
@@ -696,24 +798,41 @@ class SpatialRelease(Release):
     @features.setter
     def features(self, fc):
         self._features = fc
+        self._clear_feature_caches()
+
+    def _clear_feature_caches(self):
+        # polygons, etc. are decoded from the features on first access, and
+        # kept until the features are changed
+        self._polys_cache = None
+        self._areas_cache = None
+        self._weights_cache = None
+        self._thicknesses_cache = None
 
     @property
     def polygons(self):
-        return [shapely.geometry.shape(feat.geometry) for feat in self.features[:]]
+        if self._polys_cache is None:
+            self._polys_cache = geo_routines.shapes_from_geojson(
+                [feat.geometry for feat in self.features[:]])
+        return self._polys_cache
     
     @polygons.setter
     def polygons(self, polys):
         #polygons must be list of shapely or geojson (Multi)Polygon 
-        for feat, poly in zip(self.features[:], poly):
-            feat.geometry = geojson.loads(geojson.dumps(poly.__geo_interface__))
+        for feat, poly in zip(self.features[:], polys):
+            feat.geometry = geojson.GeoJSON.to_instance(shapely.geometry.mapping(poly))
+        self._clear_feature_caches()
 
     @property
     def thicknesses(self):
-        rv = [feat.properties.get('thickness', None) for feat in self.features[:]]
+        if self._thicknesses_cache is None:
+            self._thicknesses_cache = [feat.properties.get('thickness', None)
+                                       for feat in self.features[:]]
+        rv = self._thicknesses_cache
         return None if all([r == None for r in rv]) else rv
     
     @thicknesses.setter
     def thicknesses(self, vals):
+        self._thicknesses_cache = None
         if vals is None:
             for feat in self.features[:]:
                 del feat.properties['thickness']
@@ -725,11 +844,15 @@ class SpatialRelease(Release):
 
     @property
     def weights(self):
-        rv = [feat.properties.get('weight', None) for feat in self.features[:]]
+        if self._weights_cache is None:
+            self._weights_cache = [feat.properties.get('weight', None)
+                                   for feat in self.features[:]]
+        rv = self._weights_cache
         return None if all([r == None for r in rv]) else rv
     
     @weights.setter
     def weights(self, vals):
+        self._weights_cache = None
         if vals is None:
             for feat in self.features[:]:
                 del feat.properties['weight']
@@ -741,14 +864,34 @@ class SpatialRelease(Release):
 
     @property
     def areas(self):
-        return [geo_routines.geo_area_of_polygon(p) for p in self.polygons]
+        if self._areas_cache is None:
+            self._areas_cache = [geo_routines.geo_area_of_polygon(p)
+                                 for p in self.polygons]
+        return self._areas_cache
+
+    def contains_points(self, X, Y):
+        '''
+        Which of the points are in the release polygons
+
+        :param X, Y: arrays of longitude and latitude
+        :return: boolean array, True where the point is in any polygon
+        '''
+        pts = np.column_stack((np.asarray(X, dtype=np.float64),
+                               np.asarray(Y, dtype=np.float64)))
+        return geo_routines.bbox_prefilter_contains(pts, self.polygons).any(axis=1)
 
     def rewind(self):
         self._prepared = False
         self._mass_per_le = 0
+        self._num_ts_cache = {}
         self._release_ts = None
+        self._release_secs = None
+        self._release_data = None
         self._tris = None
+        self._tri_verts = None
         self._weights = None
+        self._alias_prob = None
+        self._alias_idx = None
         #self._pos_ts = None
 
     def get_polys_as_tris(self, polys, weights=None):
@@ -764,13 +907,14 @@ class SpatialRelease(Release):
                 tris = geo_routines.triangulate_poly(p)
 
                 #scale weight of triangles by parent poly weight
-                ws = [w * tri_weight for tri_weight in geo_routines.poly_area_weight(tris)]
-
                 _tris += tris
-                _weights += ws
+                _weights.append(w * geo_routines.poly_area_weight(tris))
+
+            _weights = np.concatenate(_weights)
         else:
             #use default weight-by-area-proportion
-            _tris = sum([geo_routines.triangulate_poly(p) for p in self.polygons], _tris)
+            _tris = list(itertools.chain.from_iterable(
+                geo_routines.triangulate_poly(p) for p in polys))
             _weights = geo_routines.poly_area_weight(_tris)
         
         assert np.isclose(sum(_weights), 1.0)
@@ -779,17 +923,15 @@ class SpatialRelease(Release):
 
     def compute_distribution(self):
         #computes polygon probability weight distribution by volume
-        areas = [geo_routines.geo_area_of_polygon(p) for p in self.polygons]
+        areas = np.asarray(self.areas, dtype=np.float64)
         #it is possible for the areas computed above to be nans, if the polygons
         #are invalid somehow. If this is the case, raise an error
-        if any(np.isnan(areas)):
+        if np.isnan(areas).any():
             raise ValueError('Invalid polygon in {}. Area computed is NaN'.format(self.name))
 
-        volumes = [a * t for a, t in zip(areas, self.thicknesses)]
-        total_vol = sum(volumes)
+        volumes = areas * np.asarray(self.thicknesses, dtype=np.float64)
 
-        weights = [v / total_vol for v in volumes]
-        return weights
+        return volumes / volumes.sum()
 
     def prepare_for_model_run(self, ts):
         '''
@@ -798,16 +940,27 @@ class SpatialRelease(Release):
         super(SpatialRelease, self).prepare_for_model_run(ts)
         #first a sanity check. The release only makes sense if using wgs84 (lon, lat).
         #for example nesdis files come in pseudo-mercator coordinates.
-        
-        for poly in self.polygons:
-            geo_routines.check_valid_polygon(poly)
+        polys = self.polygons
+
+        geo_routines.check_valid_polygons(polys)
 
         #unless user explicitly assigned weights, compute the distribution now
         if self.thicknesses:
             weights = self.compute_distribution()
         else:
             weights = self.weights
-        self._tris, self._weights = self.get_polys_as_tris(self.polygons, weights)
+        self._tris, self._weights = self.get_polys_as_tris(polys, weights)
+
+        # vertices of the triangles as one (N, 3, 2) array, so LEs can be
+        # placed in them all at once
+        self._tri_verts = np.ascontiguousarray(
+            [np.asarray(t.exterior.coords)[:3, :2] for t in self._tris],
+            dtype=np.float64)
+        self._weights = np.asarray(self._weights, dtype=np.float64)
+
+        # alias tables, so a triangle can be picked for each LE in
+        # constant time (see initialize_LEs)
+        self._alias_prob, self._alias_idx = build_alias_table(self._weights)
 
         self._prepared = True
 
@@ -820,13 +973,16 @@ class SpatialRelease(Release):
         """
 
         sl = slice(-to_rel, None, 1)
-        pts = [geo_routines.random_pt_in_tri(s) for s in np.random.choice(self._tris, to_rel, p=self._weights)]
-        pts = [np.append(pt, 0) for pt in pts] #add Z coordinate
-        
-        data['positions'][sl] = pts
+        idx = alias_sample(self._alias_prob, self._alias_idx, to_rel)
+        r1 = np.random.random(to_rel)
+        r2 = np.random.random(to_rel)
 
-        data['mass'][sl] = self._mass_per_le
-        data['init_mass'][sl] = self._mass_per_le
+        geo_routines.sample_tris_batch(self._tri_verts, idx, r1, r2,
+                                       data['positions'][sl])
+        data['positions'][sl, 2] = 0
+
+        data['mass'][sl].fill(self._mass_per_le)
+        data['init_mass'][sl].fill(self._mass_per_le)
 
     def get_polygons(self):
         '''
@@ -837,8 +993,16 @@ class SpatialRelease(Release):
         the polygons.
         '''
         uniq_polys = geo_routines.mixed_polys_to_polygon(self.polygons)
-        polycoords = [np.array(p.exterior.xy).T.astype(np.float32) for p in uniq_polys]
-        lengths = np.array([len(p) for p in polycoords]).astype(np.int32)
+        if geo_routines._vectorized_shapely and len(uniq_polys):
+            # all the exterior rings in one array, then split into views
+            rings = shapely.get_exterior_ring(np.array(uniq_polys, dtype=object))
+            coords, idx = shapely.get_coordinates(rings, return_index=True)
+            lengths = np.bincount(idx, minlength=len(uniq_polys)).astype(np.int32)
+            polycoords = np.split(coords.astype(np.float32),
+                                  np.cumsum(lengths)[:-1])
+        else:
+            polycoords = [np.array(p.exterior.xy).T.astype(np.float32) for p in uniq_polys]
+            lengths = np.array([len(p) for p in polycoords]).astype(np.int32)
         # weights = self.weights if self.weights is not None else []
         # thicknesses = self.thicknesses if self.thicknesses is not None else []
         return lengths, polycoords
@@ -850,7 +1014,7 @@ class SpatialRelease(Release):
         rt = []
         for p, w, t in zip(self.polygons, weights, thicknesses):
             if isinstance(p, shapely.geometry.MultiPolygon):
-                for subp in p:
+                for subp in p.geoms:
                     rw.append(w)
                     rt.append(t)
             else:
@@ -881,8 +1045,12 @@ def GridRelease(release_time, bounds, resolution):
     """
     lon = np.linspace(bounds[0][0], bounds[1][0], resolution)
     lat = np.linspace(bounds[0][1], bounds[1][1], resolution)
-    lon, lat = np.meshgrid(lon, lat)
-    positions = np.c_[lon.flat, lat.flat, np.zeros((resolution * resolution),)]
+
+    # same order as a meshgrid: lon varies fastest
+    positions = np.empty((resolution * resolution, 3), dtype=world_point_type)
+    positions[:, 0] = np.tile(lon, resolution)
+    positions[:, 1] = np.repeat(lat, resolution)
+    positions[:, 2] = 0.0
 
     return Release(release_time=release_time,
                           custom_positions=positions,
@@ -890,6 +1058,31 @@ def GridRelease(release_time, bounds, resolution):
                           )
 
 
+# for pulling the HHMM out of NESDIS time strings like '1520z'
+_nondigit_re = re.compile(r'\D')
+
+def _parse_nesdis_time(im_date, hhmm):
+    '''
+    datetime from a NESDIS date ('5/14/2020') and time ('1520')
+
+    Parsed by hand in the common case, as strptime is slow; anything
+    unusual goes to strptime.
+    '''
+    date_parts = im_date.split('/')
+    if (len(date_parts) == 3 and
+            len(date_parts[0]) <= 2 and len(date_parts[1]) <= 2 and
+            len(date_parts[2]) == 4 and len(hhmm) == 4 and
+            all(p.isdigit() for p in date_parts)):
+        month, day, year = (int(p) for p in date_parts)
+        return datetime(year, month, day, int(hhmm[:2]), int(hhmm[2:]))
+
+    return datetime.strptime(im_date + ' ' + hhmm, '%m/%d/%Y %H%M')
+
+
+# thickness (m) by NESDIS OILTYPE -- anything else is thin (5e-6)
+_nesdis_thickness = {'thick': 200e-6}
+
+
 class NESDISReleaseSchema(SpatialReleaseSchema):
     thicknesses = SequenceSchema(
         SchemaNode(Float()), save=False
@@ -959,17 +1152,18 @@ class NESDISRelease(SpatialRelease):
             im_date = feature.properties.get('DATE', None)
             im_time = feature.properties.get('TIME', None)
             if im_date and im_time:
-                parsed_time = ''.join([d for d in im_time if d.isdigit()])
+                parsed_time = _nondigit_re.sub('', im_time)
                 try:
                     #if time found in file, it takes precedence over supplied release_time
                     #this is necessary for webgnome (for now?)
-                    release_time = datetime.strptime(im_date + ' ' + parsed_time, '%m/%d/%Y %H%M')
+                    release_time = _parse_nesdis_time(im_date, parsed_time)
                 except ValueError as ve:
                     warnings.warn('Could not parse shapefile time: ' + str(ve))
 
             #append webgnomeclient or pygnome specific properties
             feature.properties['feature_index'] = i
-            feature.properties['thickness'] = 200e-6 if feature.properties.get('OILTYPE', '').lower() == 'thick' else 5e-6
+            feature.properties['thickness'] = _nesdis_thickness.get(
+                feature.properties.get('OILTYPE', '').lower(), 5e-6)
             feature.properties['release_time'] = release_time.isoformat()
 
         return fc
@@ -978,17 +1172,24 @@ class NESDISRelease(SpatialRelease):
     def record_areas(self):
         return self.areas
     
+    def _clear_feature_caches(self):
+        super(NESDISRelease, self)._clear_feature_caches()
+        self._oil_types_cache = None
+
     @property
     def oil_types(self):
-        return [
-            feat.properties.get('OILTYPE') if 'OILTYPE' in feat.properties
-            else 'Group_{}'.format(feat.properties.get('feature_index'))
-            for feat in self.features[:] 
-            ]
+        if self._oil_types_cache is None:
+            self._oil_types_cache = [
+                feat.properties.get('OILTYPE') if 'OILTYPE' in feat.properties
+                else 'Group_{}'.format(feat.properties.get('feature_index'))
+                for feat in self.features.features
+                ]
+        return self._oil_types_cache
 
     @oil_types.setter
     def oil_types(self, ot):
-        for o, feat in zip(ot, self.features[:]):
+        self._oil_types_cache = None
+        for o, feat in zip(ot, self.features.features):
             feat.properties['OILTYPE'] = o
 
     def to_dict(self, json_=None):
@@ -1144,33 +1345,39 @@ class VerticalPlumeRelease(Release):
         if self.num_elements:
             self.plume_gen.set_le_mass_from_total_le_count(self.num_elements)
 
-    def _plume_elem_coords(self, current_time, time_step):
+    def _plume_elem_counts(self, current_time, time_step):
         '''
-        Return a list of positions for all elements released within
-        current_time + time_step
+        Return the number of elements released at each plume coordinate
+        within current_time + time_step
         '''
         next_time = current_time + timedelta(seconds=time_step)
         elem_counts = self.plume_gen.elems_in_range(current_time, next_time)
 
-        for coord, count in zip(self.plume_gen.plume.coords, elem_counts):
-            for c in (coord,) * count:
-                yield tuple(c)
+        return np.maximum(np.asarray(elem_counts, dtype=np.intp), 0)
+
+    def _plume_elem_coords(self, current_time, time_step):
+        '''
+        Return an (N, 3) array of positions for all elements released within
+        current_time + time_step
+        '''
+        counts = self._plume_elem_counts(current_time, time_step)
+        coords = structured_to_unstructured(self.plume_gen.plume.coords,
+                                            dtype=world_point_type)
+
+        return np.repeat(coords, counts, axis=0)
 
     def num_elements_to_release(self, current_time, time_step):
         '''
         Return number of particles released in current_time + time_step
         '''
-        return len([e for e in self._plume_elem_coords(current_time,
-                                                       time_step)])
+        return int(self._plume_elem_counts(current_time, time_step).sum())
 
     def set_newparticle_positions(self, num_new_particles,
                                   current_time, time_step, data_arrays):
         '''
         Set positions for new elements added by the SpillContainer
         '''
-        coords = [e for e in self._plume_elem_coords(current_time, time_step)]
-        self.coords = np.asarray(tuple(coords),
-                                 dtype=world_point_type).reshape((-1, 3))
+        self.coords = self._plume_elem_coords(current_time, time_step)
 
         if self.coords.shape[0] != num_new_particles:
             raise RuntimeError('The Specified number of new particals does not'
@@ -1224,6 +1431,9 @@ class InitElemsFromFile(Release):
         self.set_newparticle_positions = self._set_data_arrays
 
     def _read_data_file(self, filename, index, time):
+        # imported here, so that netCDF4 is only loaded if it's needed
+        from gnome.outputters import NetCDFOutput
+
         if time is not None:
             self._init_data = NetCDFOutput.read_data(filename, time,
                                                      which_data='all')[0]
@@ -1272,12 +1482,12 @@ def release_from_splot_data(release_time, filename):
     For each (longitude, latitude) release num_LEs_per_splot points
     '''
     # use numpy loadtxt - much faster
-    pos = np.loadtxt(filename)
-    num_per_pos = np.asarray(pos[:, 2], dtype=int)
-    pos[:, 2] = 0
+    splots = np.loadtxt(filename, usecols=(0, 1, 2), ndmin=2)
+    num_per_pos = splots[:, 2].astype(np.intp)
 
     # 'loaded data, repeat positions for splots next'
-    start_positions = np.repeat(pos, num_per_pos, axis=0)
+    start_positions = np.zeros((num_per_pos.sum(), 3), dtype=world_point_type)
+    start_positions[:, :2] = np.repeat(splots[:, :2], num_per_pos, axis=0)
 
     return Release(release_time=release_time,
                           custom_positions=start_positions)
@@ -10,7 +10,6 @@ set of arrays. The spills themselves provide some of the arrays themselves
 
 
 
-from past.types import basestring
 
 import os
 from collections import namedtuple
@@ -577,7 +576,7 @@ class SpillContainer(AddLogger, SpillContainerData):
         in which case, it is the name of the array so return it. If its not
         a string, then return the at.name attribute.
         '''
-        if isinstance(at, basestring):
+        if isinstance(at, str):
             return at
         else:
             return at.name
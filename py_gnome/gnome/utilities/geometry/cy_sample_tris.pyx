@@ -0,0 +1,43 @@
+#!/usr/bin/env python
+
+"""
+Cython version of the barycentric triangle sampler
+
+Used by geo_routines.sample_tris_batch for batches too small for numba,
+or when numba is not available.
+"""
+
+import cython
+from libc.math cimport sqrt
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+@cython.cdivision(True)
+def sample_tris_batch(double[:, :, :] tris,
+                      Py_ssize_t[:] idx,
+                      double[:] r1,
+                      double[:] r2,
+                      double[:, :] out):
+    """
+    sample_tris_batch(tris, idx, r1, r2, out)
+
+    Place points in triangles, using barycentric coordinates
+
+    :param tris: (N, 3, 2) float64 array of triangle vertices
+    :param idx: (M,) intp array -- the triangle to put each point in
+    :param r1, r2: (M,) float64 arrays of uniform random numbers in [0, 1)
+    :param out: (M, >=2) float64 array -- the points are written to out[:, :2]
+    """
+    cdef Py_ssize_t i, j
+    cdef double s, a, b, c
+
+    with nogil:
+        for i in range(idx.shape[0]):
+            j = idx[i]
+            s = sqrt(r1[i])
+            a = 1.0 - s
+            b = s * (1.0 - r2[i])
+            c = s * r2[i]
+            out[i, 0] = a * tris[j, 0, 0] + b * tris[j, 1, 0] + c * tris[j, 2, 0]
+            out[i, 1] = a * tris[j, 0, 1] + b * tris[j, 1, 1] + c * tris[j, 2, 1]
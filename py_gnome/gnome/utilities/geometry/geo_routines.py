@@ -1,5 +1,10 @@
+import concurrent.futures
 import functools
+import math
+import os
 import shapely
+import shapely.ops
+import shapely.prepared
 import pyproj
 import geojson
 import shapefile
@@ -7,12 +12,22 @@ import warnings
 import zipfile
 import trimesh
 
-from shapely.geometry import Polygon
+from shapely.geometry import Polygon, Point
 
 import numpy as np
 import random
 
 geod = pyproj.Geod(ellps='WGS84')
+
+# shapely 2 has vectorized functions that work on arrays of geometries
+_vectorized_shapely = int(shapely.__version__.split('.')[0]) >= 2
+
+# pyproj Transformers can be shared between threads as of 3.1
+_threadsafe_pyproj = tuple(int(v) for v in pyproj.__version__.split('.')[:2]) >= (3, 1)
+
+# transform_xy only uses threads for more points than this
+transform_chunk_size = 100000
+
 def geo_area_of_polygon(poly):
     '''
     :param poly: 
@@ -24,6 +39,41 @@ def geo_area_of_polygon(poly):
         poly = shapely.geometry.shape(poly)
     return abs(geod.geometry_area_perimeter(poly)[0])
 
+def shapes_from_geojson(geoms):
+    '''
+    shapely.geometry.shape() for a sequence of geojson geometries
+
+    With shapely 2, the simple Polygons (one ring, no holes, 2D) are all
+    built with one call to shapely.polygons(). Everything else is built
+    one at a time.
+
+    :param geoms: sequence of geojson geometries (or dicts)
+    :return: list of shapely geometries
+    '''
+    if not _vectorized_shapely:
+        return [shapely.geometry.shape(g) for g in geoms]
+
+    shapes = [None] * len(geoms)
+    simple = []
+    rings = []
+    for i, g in enumerate(geoms):
+        if g['type'] == 'Polygon' and len(g['coordinates']) == 1:
+            ring = np.asarray(g['coordinates'][0], dtype=np.float64)
+            if ring.ndim == 2 and ring.shape[1] == 2 and len(ring) >= 4:
+                simple.append(i)
+                rings.append(ring)
+                continue
+        shapes[i] = shapely.geometry.shape(g)
+
+    if simple:
+        ring_idx = np.repeat(np.arange(len(rings)), [len(r) for r in rings])
+        polys = shapely.polygons(shapely.linearrings(np.concatenate(rings),
+                                                     indices=ring_idx))
+        for i, poly in zip(simple, polys):
+            shapes[i] = poly
+
+    return shapes
+
 def triangulate_poly(poly):
     '''
     :param poly: shapely or geojson MultiPolygon or Polygon
@@ -32,29 +82,33 @@ def triangulate_poly(poly):
     '''
     if isinstance(poly, (geojson.MultiPolygon, geojson.Polygon)):
         poly = shapely.geometry.shape(poly)
-    retval = []
     if isinstance(poly, shapely.geometry.MultiPolygon):
-        for p in poly:
-            pts, tris = trimesh.creation.triangulate_polygon(p, engine='earcut')
-            retval = retval + [Polygon(k) for k in pts[tris]]
+        parts = poly.geoms
     else:
-        pts, tris = trimesh.creation.triangulate_polygon(poly, engine='earcut')
-        retval = [Polygon(k) for k in pts[tris]]
+        parts = [poly]
+    retval = []
+    for p in parts:
+        pts, tris = trimesh.creation.triangulate_polygon(p, engine='earcut')
+        if _vectorized_shapely:
+            retval.extend(shapely.polygons(pts[tris]))
+        else:
+            retval.extend(Polygon(k) for k in pts[tris])
     return retval
 
 def poly_area_weight(polys, geo_area=False):
     '''
     :param polys: iterable of shapely.Polygon
     :param geo_area: If true, calculates using geo area (slower, more accurate)
+
+    :return: numpy array of weights, summing to 1
     '''
-    areas = None
     if geo_area:
-        areas = [geo_area_of_polygon(p) for p in polys]
+        areas = np.array([geo_area_of_polygon(p) for p in polys])
+    elif _vectorized_shapely:
+        areas = shapely.area(np.asarray(polys, dtype=object))
     else:
-        areas = [p.area for p in polys]
-    t_area = sum(areas)
-    weights = [s/t_area for s in areas]
-    return weights
+        areas = np.array([p.area for p in polys])
+    return areas / areas.sum()
 
 def mixed_polys_to_polygon(polys):
     '''
@@ -65,7 +119,7 @@ def mixed_polys_to_polygon(polys):
     for p in polys:
         p = shapely.geometry.shape(p) #to handle geojson.(Multi)Polygon objects
         if isinstance(p, shapely.geometry.MultiPolygon):
-            for subp in p:
+            for subp in p.geoms:
                 rv.append(subp)
         else:
             rv.append(p)
@@ -76,7 +130,7 @@ def check_valid_polygon(poly):
     checks that a shapely Polygon object at least has valid values for coordinates
     """
     if isinstance(poly, shapely.geometry.MultiPolygon):
-        for p in poly:
+        for p in poly.geoms:
             for point in p.exterior.coords:
                 assert -360 < point[0] < 360
                 assert -90 < point[1] < 90
@@ -84,7 +138,48 @@ def check_valid_polygon(poly):
         for point in poly.exterior.coords:
             assert -360 < point[0] < 360
             assert -90 < point[1] < 90
-            
+
+
+class InvalidPolygonError(ValueError, AssertionError):
+    """
+    A polygon has coordinates outside the valid longitude/latitude range
+
+    Also an AssertionError, which is what check_valid_polygon raises.
+    """
+    pass
+
+
+def check_valid_polygons(polys):
+    """
+    vectorized check_valid_polygon for a list of (Multi)Polygons
+
+    Like check_valid_polygon, only the exterior rings are checked.
+
+    Raises an InvalidPolygonError if any coordinates are out of the lon/lat
+    range
+    """
+    if _vectorized_shapely:
+        polys = np.asarray(polys, dtype=object)
+        parts, part_index = shapely.get_parts(polys, return_index=True)
+        coords, index = shapely.get_coordinates(
+            shapely.get_exterior_ring(parts), return_index=True)
+        index = part_index[index]
+    else:
+        parts = [mixed_polys_to_polygon([p]) for p in polys]
+        coords = [np.asarray(sp.exterior.coords)[:, :2]
+                  for ps in parts for sp in ps]
+        index = np.repeat(np.arange(len(polys)),
+                          [sum(len(sp.exterior.coords) for sp in ps)
+                           for ps in parts])
+        coords = np.concatenate(coords)
+
+    bad = ~((-360 < coords[:, 0]) & (coords[:, 0] < 360) &
+            (-90 < coords[:, 1]) & (coords[:, 1] < 90))
+    if bad.any():
+        raise InvalidPolygonError('Polygon(s) {} have coordinates outside '
+                                  'the valid longitude/latitude range'
+                                  .format(np.unique(index[bad]).tolist()))
+
 #tri is a Shapely.Polygon, or 3x2 array of coords
 #returns a 2D coordinate
 def random_pt_in_tri(tri):
@@ -105,6 +200,141 @@ def random_pt_in_tri(tri):
     RPP = A + R*AB + S*AC
     return RPP
 
+def _sample_tris_loop(tris, idx, r1, r2, out):
+    # pure python reference version of the numba kernel
+    for i in range(idx.shape[0]):
+        j = idx[i]
+        s = math.sqrt(r1[i])
+        a = 1.0 - s
+        b = s * (1.0 - r2[i])
+        c = s * r2[i]
+        out[i, 0] = a * tris[j, 0, 0] + b * tris[j, 1, 0] + c * tris[j, 2, 0]
+        out[i, 1] = a * tris[j, 0, 1] + b * tris[j, 1, 1] + c * tris[j, 2, 1]
+
+
+def _sample_tris_numpy(tris, idx, r1, r2, out):
+    tris = tris[idx]
+    s = np.sqrt(r1)
+    a = 1 - s
+    b = s * (1 - r2)
+    c = s * r2
+    out[:, 0] = a * tris[:, 0, 0] + b * tris[:, 1, 0] + c * tris[:, 2, 0]
+    out[:, 1] = a * tris[:, 0, 1] + b * tris[:, 1, 1] + c * tris[:, 2, 1]
+
+
+def _sample_tris_cython(tris, idx, r1, r2, out):
+    # the memoryviews need exact dtypes
+    _cy_sample_tris(tris,
+                    np.asarray(idx, dtype=np.intp),
+                    np.asarray(r1, dtype=np.float64),
+                    np.asarray(r2, dtype=np.float64),
+                    out)
+
+
+try:
+    from .cy_sample_tris import sample_tris_batch as _cy_sample_tris
+except ImportError:
+    _cy_sample_tris = None
+
+# batches smaller than this aren't worth importing numba for. Once it is
+# loaded, the kernel is ~20x faster than numpy and a bit faster than the
+# Cython version at 10k points (single core) -- more with more cores.
+numba_min_batch = 10000
+
+# None: not tried yet, False: numba isn't installed
+_numba_kernel = None
+
+
+def _numba_sample_tris():
+    # importing numba and compiling the kernel is slow, so it is
+    # put off until there is a batch big enough to need it
+    global _numba_kernel
+
+    if _numba_kernel is None:
+        try:
+            from numba import njit, prange
+        except ImportError:
+            _numba_kernel = False
+        else:
+            @njit(parallel=True, fastmath=True, cache=True)
+            def kernel(tris, idx, r1, r2, out):
+                # same as _sample_tris_loop, with a parallel loop
+                for i in prange(idx.shape[0]):
+                    j = idx[i]
+                    s = math.sqrt(r1[i])
+                    a = 1.0 - s
+                    b = s * (1.0 - r2[i])
+                    c = s * r2[i]
+                    out[i, 0] = (a * tris[j, 0, 0] + b * tris[j, 1, 0] +
+                                 c * tris[j, 2, 0])
+                    out[i, 1] = (a * tris[j, 0, 1] + b * tris[j, 1, 1] +
+                                 c * tris[j, 2, 1])
+
+            _numba_kernel = kernel
+
+    return _numba_kernel
+
+
+def sample_tris_batch(tris, idx, r1, r2, out):
+    '''
+    Place points in triangles, using barycentric coordinates
+
+    Batches of numba_min_batch or more points use numba if it is
+    installed. Otherwise the Cython extension is used if it was built,
+    numpy if not.
+
+    :param tris: (N, 3, 2) float64 array of triangle vertices
+    :param idx: for each point, the index of the triangle to put it in
+    :param r1, r2: for each point, uniform random numbers in [0, 1)
+    :param out: (len(idx), >=2) array -- the points are written to out[:, :2]
+    '''
+    if len(idx) >= numba_min_batch:
+        kernel = _numba_sample_tris()
+        if kernel:
+            kernel(tris, idx, r1, r2, out)
+            return
+
+    if _cy_sample_tris is not None:
+        _sample_tris_cython(tris, idx, r1, r2, out)
+    else:
+        _sample_tris_numpy(tris, idx, r1, r2, out)
+
+
+def bbox_prefilter_contains(pts, polys):
+    '''
+    Which points are in which polygons
+
+    Points are first tested against the bounding boxes of all the polygons
+    at once, so the (expensive) point in polygon test is only done for
+    the points inside a polygon's bounding box.
+
+    :param pts: (N, 2) array of points (extra columns are ignored)
+    :param polys: sequence of M shapely (Multi)Polygons
+
+    :return: (N, M) boolean array -- True if point i is in polygon j
+    '''
+    pts = np.asarray(pts, dtype=np.float64)
+    x = pts[:, 0]
+    y = pts[:, 1]
+    bounds = np.array([p.bounds for p in polys]).reshape((-1, 4))
+
+    candidates = ((x[:, None] >= bounds[:, 0]) & (x[:, None] <= bounds[:, 2]) &
+                  (y[:, None] >= bounds[:, 1]) & (y[:, None] <= bounds[:, 3]))
+
+    result = np.zeros(candidates.shape, dtype=bool)
+    ipt, ipoly = np.nonzero(candidates)
+    if _vectorized_shapely:
+        # preparing is done in place, and kept with the geometry objects,
+        # so repeated calls with the same polygons don't pay for it again
+        polys = np.asarray(polys, dtype=object)
+        shapely.prepare(polys)
+        result[ipt, ipoly] = shapely.contains_xy(polys[ipoly], x[ipt], y[ipt])
+    else:
+        prepared = [shapely.prepared.prep(p) for p in polys]
+        result[ipt, ipoly] = [prepared[j].contains(Point(x[i], y[i]))
+                              for i, j in zip(ipt, ipoly)]
+    return result
+
 def get_shapefile_args(filename):
     """
     :param filename: string path of a zipped shapefile
@@ -138,6 +368,84 @@ def open_shapefile(filename):
         rv = shapefile.Reader(**args)
         return rv
 
+@functools.lru_cache(maxsize=32)
+def lonlat_transformer(src):
+    """
+    A pyproj.Transformer from the given projection to EPSG:4326 (lon, lat)
+
+    Transformers are expensive to create, so they are cached and reused.
+
+    :param src: EPSG code of the source projection, or anything else
+                pyproj.CRS accepts as a string (e.g. WKT)
+    """
+    if isinstance(src, int):
+        src = "epsg:{0}".format(src)
+    return pyproj.Transformer.from_crs(src, "epsg:4326", always_xy=True)
+
+
+def is_lonlat_crs(crs):
+    """
+    True if a pyproj.CRS is (equivalent to) EPSG:4326, so coordinates in
+    it don't need to be transformed.
+    """
+    return (crs.to_epsg() == 4326 or
+            crs.equals(pyproj.CRS.from_epsg(4326), ignore_axis_order=True))
+
+
+def transform_xy(transformer, x, y, chunk_size=None, max_workers=None):
+    """
+    transformer.transform(x, y) for large arrays of points
+
+    Big arrays are split into chunks that are transformed in a thread pool
+    -- PROJ releases the GIL, so they run in parallel. Only done with
+    pyproj >= 3.1, where Transformers are thread safe.
+
+    :param x, y: 1-D arrays of coordinates
+    :param chunk_size=None: points per chunk. Defaults to
+                            transform_chunk_size
+    :param max_workers=None: threads to use. Defaults to the number of CPUs
+    :return: transformed x, y arrays
+    """
+    chunk_size = transform_chunk_size if chunk_size is None else chunk_size
+    n = len(x)
+    if n <= chunk_size or not _threadsafe_pyproj:
+        return transformer.transform(x, y)
+
+    starts = range(0, n, chunk_size)
+    if max_workers is None:
+        max_workers = os.cpu_count() or 1
+    with concurrent.futures.ThreadPoolExecutor(min(max_workers, len(starts))) as ex:
+        parts = list(ex.map(lambda i: transformer.transform(x[i:i + chunk_size],
+                                                            y[i:i + chunk_size]),
+                            starts))
+
+    return (np.concatenate([p[0] for p in parts]),
+            np.concatenate([p[1] for p in parts]))
+
+
+def transform_geometries(geoms, transformer):
+    """
+    Apply a pyproj.Transformer to a sequence of shapely geometries
+
+    With shapely 2 (and 2D geometries) the coordinates of all the
+    geometries are transformed in one call to the transformer, and the
+    geometries rebuilt from the result in one call to shapely.
+
+    :param geoms: sequence of shapely geometries
+    :param transformer: pyproj.Transformer
+    :return: list of transformed geometries
+    """
+    if _vectorized_shapely and len(geoms):
+        geoms = np.array(geoms, dtype=object)
+        if not shapely.has_z(geoms).any():
+            coords = shapely.get_coordinates(geoms)
+            x, y = transform_xy(transformer, coords[:, 0], coords[:, 1])
+            return list(shapely.set_coordinates(geoms.copy(),
+                                                np.column_stack((x, y))))
+
+    return [shapely.ops.transform(transformer.transform, g) for g in geoms]
+
+
 def load_shapefile(filename, transform_crs=True):
     """
     load up a generic shapefile into a FeatureCollection
@@ -148,36 +456,27 @@ def load_shapefile(filename, transform_crs=True):
     :return: geojson.FeatureCollection
     """
     rv = open_shapefile(filename)
-    rv = geojson.loads(geojson.dumps(rv.__geo_interface__))
+    rv = geojson.GeoJSON.to_instance(rv.__geo_interface__)
     args = get_shapefile_args(filename)
     pf = None
     with zipfile.ZipFile(filename, 'r') as zsf:
         pf = pyproj.CRS.from_wkt(zsf.open(args['prj'], 'r').readline().decode('utf-8'))
     if not transform_crs:
-        if pf.to_epsg() != '4326':
+        if not is_lonlat_crs(pf):
             warnings.warn('shapefile is using epsg:{0} not epsg:4326!'.format(pf.to_epsg()))
     else:
-        if pf.to_epsg() != '4326':
-            if int(pyproj.__version__[0]) < 2:
-                Proj1 = pyproj.Proj(init='epsg:3857')
-                Proj2 = pyproj.Proj(init='epsg:4326')
-                transformer = functools.partial(
-                    pyproj.transform,
-                    Proj1,
-                    Proj2)
-            else:
-                transformer = pyproj.Transformer.from_crs(
-                    "epsg:{0}".format(pf.to_epsg()),
-                    "epsg:4326",
-                    always_xy=True
-                )
+        # nothing to do if it's already lon/lat
+        if not is_lonlat_crs(pf):
+            transformer = lonlat_transformer(pf.to_epsg() or pf.to_wkt())
             if hasattr(rv, 'bbox'):
                 xx, yy = transformer.transform([rv.bbox[0],rv.bbox[2]],[rv.bbox[1],rv.bbox[3]])
                 rv.bbox = [xx[0], yy[0], xx[1], yy[1]]
-            for feature in rv.features:
-                old_geo = shapely.geometry.shape(feature.geometry)
-                #Geometries can be MultiPolygons or Polygons
-                #Each needs to be converted to EPSG:4326
-                new_geo = shapely.ops.transform(transformer.transform, old_geo)
-                feature.geometry = geojson.loads(geojson.dumps(new_geo.__geo_interface__))
-        return rv
\ No newline at end of file
+            #Geometries can be MultiPolygons or Polygons
+            #Each needs to be converted to EPSG:4326
+            old_geos = shapes_from_geojson([feature.geometry
+                                            for feature in rv.features])
+            new_geos = transform_geometries(old_geos, transformer)
+            for feature, new_geo in zip(rv.features, new_geos):
+                feature.geometry = geojson.GeoJSON.to_instance(
+                    shapely.geometry.mapping(new_geo))
+    return rv
\ No newline at end of file
@@ -124,6 +124,58 @@ def random_with_persistance(
     return array
 
 
+def build_alias_table(weights):
+    """
+    Build the tables for sampling from a discrete distribution with
+    Walker's alias method: after this O(N) setup, each sample is O(1).
+
+    :param weights: probability of each index. Normalized here, so they
+        don't need to sum to exactly 1.
+
+    :returns: (prob, alias) arrays to pass to alias_sample()
+    """
+    weights = np.asarray(weights, dtype=np.float64)
+    n = len(weights)
+
+    scaled = weights * n / weights.sum()
+    prob = np.ones((n,), dtype=np.float64)
+    alias = np.arange(n)
+
+    small = list(np.nonzero(scaled < 1.0)[0])
+    large = list(np.nonzero(scaled >= 1.0)[0])
+
+    while small and large:
+        s = small.pop()
+        l = large.pop()
+
+        prob[s] = scaled[s]
+        alias[s] = l
+
+        scaled[l] = (scaled[l] + scaled[s]) - 1.0
+        if scaled[l] < 1.0:
+            small.append(l)
+        else:
+            large.append(l)
+
+    # anything left over is 1 within roundoff, so keeps prob = 1
+
+    return prob, alias
+
+
+def alias_sample(prob, alias, size):
+    """
+    Sample indexes from the tables made by build_alias_table()
+
+    :param prob, alias: arrays returned by build_alias_table()
+    :param size: number of samples
+
+    :returns: integer array of indexes
+    """
+    k = np.random.randint(0, len(prob), size)
+
+    return np.where(np.random.random(size) < prob[k], k, alias[k])
+
+
 def seed(seed=1):
     """
     Set the C++, the python and the numpy random seed to desired value
@@ -11,14 +11,21 @@ Download data from remote server
 # from builtins import *
 
 import os
+import time
+import socket
+import json
+import uuid
+import shutil
+import hashlib
+import tempfile
 
 try:  # the py3 way
     from urllib.parse import urljoin
-    from urllib.request import urlopen
-    from urllib.error import HTTPError
+    from urllib.request import urlopen, Request
+    from urllib.error import HTTPError, URLError
 except ImportError:  # the py2 way
     from urlparse import urljoin
-    from urllib2 import urlopen, HTTPError
+    from urllib2 import urlopen, Request, HTTPError, URLError
 
 
 # import urllib.request, urllib.error, urllib.parse
@@ -31,8 +38,150 @@ from progressbar import (ProgressBar, Percentage, FileTransferSpeed,
 data_server = 'http://gnome.orr.noaa.gov/py_gnome_testdata/'
 CHUNKSIZE = 1024 * 1024
 
+# seconds to wait for the server when revalidating a cached file
+HEAD_TIMEOUT = 10
 
-def get_datafile(filename):
+
+def _get_cache_dir():
+    """
+    directory downloaded files are cached in, so they can be shared between
+    scripts, and not downloaded again.
+
+    GNOME_DATA_CACHE if it is set, ~/.cache/gnome otherwise. It is looked
+    up each time, so it can be set after gnome has been imported.
+    """
+    return os.environ.get('GNOME_DATA_CACHE',
+                          os.path.join(os.path.expanduser('~'),
+                                       '.cache', 'gnome'))
+
+
+def _cache_path(url):
+    """
+    path in the cache dir for the file downloaded from url
+    """
+    key = hashlib.sha1(url.encode('utf-8')).hexdigest()
+
+    return os.path.join(_get_cache_dir(), key)
+
+
+def _is_current(url, cached):
+    """
+    Check the ETag / Last-Modified saved with the cached file against
+    the server's, with a HEAD request.
+
+    Returns False if they differ, if there is nothing to compare, or if
+    the server can't be reached.
+    """
+    try:
+        with open(cached + '.meta') as fh:
+            meta = json.load(fh)
+    except (IOError, OSError, ValueError):
+        return False
+
+    if meta.get('etag') is None and meta.get('last_modified') is None:
+        return False
+
+    req = Request(url)
+    req.get_method = lambda: 'HEAD'
+
+    try:
+        with urlopen(req, timeout=HEAD_TIMEOUT) as resp:
+            headers = resp.info()
+    except (HTTPError, URLError, socket.timeout):
+        return False
+
+    return (headers.get('ETag') == meta.get('etag') and
+            headers.get('Last-Modified') == meta.get('last_modified'))
+
+
+def _from_cache(url, filename, max_age=None, revalidate=False):
+    """
+    Link (or copy) the cached file for url to filename.
+
+    Returns True if there was a usable cached file, False otherwise.
+    """
+    cached = _cache_path(url)
+
+    if not os.path.exists(cached):
+        return False
+
+    if (max_age is not None and
+            time.time() - os.path.getmtime(cached) > max_age):
+        return False
+
+    if revalidate and not _is_current(url, cached):
+        return False
+
+    _link_or_copy(cached, filename)
+
+    return True
+
+
+def _link_or_copy(src, dst):
+    """
+    Hard link dst to src -- the data files can be large -- or copy it if
+    the file system can't link them (different devices, no support, ...)
+    """
+    try:
+        os.link(src, dst)
+    except OSError:
+        shutil.copyfile(src, dst)
+
+
+def _atomic_link_or_copy(src, dst):
+    """
+    _link_or_copy src to dst through a temp file in dst's directory, so
+    other processes never see a partly written dst.
+    """
+    tmp = '{}.{}.tmp'.format(dst, uuid.uuid4().hex)
+
+    try:
+        _link_or_copy(src, tmp)
+        os.replace(tmp, dst)
+    except BaseException:
+        if os.path.exists(tmp):
+            os.remove(tmp)
+        raise
+
+
+def _to_cache(url, filename, headers):
+    """
+    Store a copy of the downloaded file, and the headers needed to tell
+    if it has changed on the server.
+
+    Failing to cache is not an error -- the file has been downloaded.
+    """
+    cached = _cache_path(url)
+    cache_dir = os.path.dirname(cached)
+
+    try:
+        if not os.path.exists(cache_dir):
+            os.makedirs(cache_dir)
+
+        _atomic_link_or_copy(filename, cached)
+
+        fd, tmp = tempfile.mkstemp(dir=cache_dir)
+        with os.fdopen(fd, 'w') as fh:
+            json.dump({'url': url,
+                       'etag': headers.get('ETag'),
+                       'last_modified': headers.get('Last-Modified')},
+                      fh)
+        os.replace(tmp, cached + '.meta')
+    except (IOError, OSError):
+        pass
+
+
+def clear_datafile_cache():
+    """
+    Remove all the files in the download cache
+    """
+    cache_dir = _get_cache_dir()
+
+    if os.path.isdir(cache_dir):
+        shutil.rmtree(cache_dir)
+
+
+def get_datafile(filename, cache=None):
     """
     Looks to see if filename exists in local directory. If it exists,
     then it simply returns the 'filename' back as a string.
@@ -45,9 +194,25 @@ def get_datafile(filename):
     If file is not found or server is down, it re-throws the HTTPError raised
     by urllib2.urlopen
 
+    Downloaded files can also be kept in a cache directory
+    (``~/.cache/gnome`` or the ``GNOME_DATA_CACHE`` environment variable),
+    so the same file is only downloaded once, even if it is requested at
+    different paths. The cache is not used by default -- see the cache
+    parameter, and gnome.scripting.get_datafile, which does use it.
+
     :param filename: path to the file including filename
     :type filename: string
 
+    :param cache: how to use the download cache:
+                  'if-missing': use the cached file if there is one,
+                  'revalidate': use the cached file if the server's ETag
+                  and Last-Modified headers still match it,
+                  'always': always download, then update the cache,
+                  'max-age=N': use the cached file if it is less than N
+                  seconds old,
+                  None (default): do not use the cache at all.
+    :type cache: string
+
     :exception: raises urllib2.HTTPError if server is down or file not found
                 on server
 
@@ -66,8 +231,27 @@ def get_datafile(filename):
         if path_ == '':
             path_ = '.'     # relative to current path
 
+        url = urljoin(data_server, fname)
+
+        if cache in (None, 'if-missing', 'revalidate', 'always'):
+            max_age = None
+        elif isinstance(cache, str) and cache.startswith('max-age='):
+            max_age = float(cache[len('max-age='):])
+        else:
+            raise ValueError("cache must be one of 'if-missing', "
+                             "'revalidate', 'always', 'max-age=N' or None, "
+                             "not {!r}".format(cache))
+
+        if not os.path.exists(path_):
+            os.makedirs(path_)
+
+        if (cache is not None and cache != 'always' and
+                _from_cache(url, filename, max_age,
+                            revalidate=(cache == 'revalidate'))):
+            return filename
+
         try:
-            resp = urlopen(urljoin(data_server, fname))
+            resp = urlopen(url)
         except HTTPError as ex:
             ex.msg = ("{0}. '{1}' not found on server or server is down"
                       .format(ex.msg, fname))
@@ -88,9 +272,6 @@ def get_datafile(filename):
                            maxval=int(resp.info()['Content-Length'])
                            ).start()
 
-        if not os.path.exists(path_):
-            os.makedirs(path_)
-
         sz_read = 0
         with open(filename, 'wb') as fh:
             # while sz_read < resp.info().getheader('Content-Length')
@@ -108,4 +289,8 @@ def get_datafile(filename):
                         pbar.update(CHUNKSIZE)
 
         pbar.finish()
+
+        if cache is not None:
+            _to_cache(url, filename, resp.info())
+
         return filename
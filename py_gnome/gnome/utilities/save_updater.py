@@ -5,7 +5,6 @@
 
 
 
-from past.types import basestring
 
 import json
 import logging
@@ -14,8 +13,14 @@ import sys
 import contextlib
 import os
 import re
+import shutil
 import zipfile
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 log = logging.getLogger(__name__)
 
 errortypes = [
@@ -25,6 +30,25 @@ errortypes = [
 ]
 
 
+def load_json(fname):
+    '''
+    Read a json file -- with orjson if it's installed, as it is much faster
+
+    orjson is stricter than json (it won't read NaN, for instance), so
+    anything it can't read is passed on to json.
+    '''
+    with open(fname, 'rb') as fp:
+        raw = fp.read()
+
+    if orjson is not None:
+        try:
+            return orjson.loads(raw)
+        except orjson.JSONDecodeError:
+            pass
+
+    return json.loads(raw)
+
+
 @contextlib.contextmanager
 def remember_cwd(new_wd):
     curdir = os.getcwd()
@@ -36,7 +60,7 @@ def remember_cwd(new_wd):
 
 
 def update_savefile(save_directory):
-    if not isinstance(save_directory, basestring) or not os.path.isdir(save_directory):
+    if not isinstance(save_directory, str) or not os.path.isdir(save_directory):
         raise ValueError('Must unzip save to directory in order to upgrade it to '
                          'the latest version')
 
@@ -45,8 +69,7 @@ def update_savefile(save_directory):
 
     with remember_cwd(save_directory):
         # get current save file version
-        allfiles = glob.glob('*')
-        if 'version.txt' in allfiles:
+        if os.path.isfile('version.txt'):
             with open('version.txt') as fp:
                 v = int(fp.readline())
         else:
@@ -117,23 +140,22 @@ def v0tov1(messages, errors):
     spills = []
     inits = []
     for fname in jsonfiles:
-        with open(fname, 'r') as fn:
-            json_ = json.load(fn)
-            if 'obj_type' in json_:
-                if ('Water' in json_['obj_type']
-                    and 'environment' in json_['obj_type']
-                    and water_json is None):
-                    water_json = (fname, json_)
+        json_ = load_json(fname)
+        if 'obj_type' in json_:
+            if ('Water' in json_['obj_type']
+                and 'environment' in json_['obj_type']
+                and water_json is None):
+                water_json = (fname, json_)
 
-                if ('element_type.ElementType' in json_['obj_type']
-                    and element_type_json is None):
-                    element_type_json = (fname, json_)
+            if ('element_type.ElementType' in json_['obj_type']
+                and element_type_json is None):
+                element_type_json = (fname, json_)
 
-                if 'gnome.spill.spill.Spill' in json_['obj_type']:
-                    spills.append((fname, json_))
+            if 'gnome.spill.spill.Spill' in json_['obj_type']:
+                spills.append((fname, json_))
 
-                if 'initializers' in json_['obj_type']:
-                    inits.append((fname, json_))
+            if 'initializers' in json_['obj_type']:
+                inits.append((fname, json_))
 
     # Generate new substance object
     if water_json is None:
@@ -184,7 +206,8 @@ def extract_zipfile(zip_file, to_folder='.'):
             prefix = folders[0]
 
         fn_edits = {}
-        for name in zf.namelist():
+        for info in zf.infolist():
+            name = info.filename
             if (prefix and name.find(prefix) != 0) or name.endswith('/'):
                 # ignores the __MACOSX files
                 pass
@@ -195,23 +218,24 @@ def extract_zipfile(zip_file, to_folder='.'):
                     log.info('Invalid filename found: {0}'.format(orig))
                     fn_edits[orig] = fn
 
+                # stream it out, rather than reading the whole member
                 target = os.path.join(to_folder, fn)
-                with open(target, 'wb') as f:
-                    f.write(zf.read(name))
+                with zf.open(info) as src, open(target, 'wb') as f:
+                    shutil.copyfileobj(src, f, 1 << 20)
         if len(fn_edits) > 0:
             log.info('Save file contained invalid names. '
                      'Editing extracted json to maintain save file integrity.')
+            # all the edits are done in one pass over each file -- longest
+            # names first, so a name that contains another one wins
+            edit_re = re.compile('|'.join(re.escape(k) for k in
+                                          sorted(fn_edits, key=len, reverse=True)))
             for jsonfile in glob.glob(os.path.join(to_folder, '*.json')):
                 # if any file name edits were made, references may need to be updated too
                 # otherwise the .json file wont be found
-                contents = None
-                replaced = False
                 with open(jsonfile, 'r') as jf:
                     contents = jf.read()
-                    for k, v in list(fn_edits.items()):
-                        if k in contents:
-                            contents = contents.replace(k, v)
-                            replaced = True
+                contents, replaced = edit_re.subn(lambda m: fn_edits[m.group(0)],
+                                                  contents)
                 if replaced:
                     with open(jsonfile, 'w') as jf:
                         jf.write(contents)
@@ -223,13 +247,17 @@ def extract_zipfile(zip_file, to_folder='.'):
             work(zf)
 
 
+# characters that aren't allowed in file names on this platform
+if sys.platform == "win32":
+    _invalid_filename_chars = re.compile(r'[\\\\/*?:"<>|]')
+else:
+    _invalid_filename_chars = re.compile(r'[/]')
+
+
 def sanitize_filename(fname):
     '''
     '''
-    if sys.platform == "win32":
-        return re.sub(r'[\\\\/*?:"<>|]', "", fname)
-    else:
-        return re.sub(r'[/]', "", fname)
+    return _invalid_filename_chars.sub("", fname)
 
 
 all_update_steps = [v0tov1]
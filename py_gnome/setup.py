@@ -567,6 +567,14 @@ extensions.append(Extension("gnome.utilities.geometry.cy_point_in_polygon",
                             extra_link_args=link_args,
                             ))
 
+extensions.append(Extension("gnome.utilities.geometry.cy_sample_tris",
+                            sources=[os.path.join(poly_cypath,
+                                                  'cy_sample_tris.pyx')],
+                            include_dirs=include_dirs,
+                            extra_compile_args=compile_args,
+                            extra_link_args=link_args,
+                            ))
+
 if sys.version_info.major == 2:
     # this doesn't work under Python3
     extensions.append(Extension("gnome.utilities.file_tools.filescanner",
@@ -600,7 +608,8 @@ setup(name='pyGnome',
       package_dir={'gnome': 'gnome'},
       package_data={'gnome': ['data/yeardata/*',
                               'outputters/sample.b64',
-                              'weatherers/platforms.json'
+                              'weatherers/platforms.json',
+                              'scripting/__init__.pyi',
                               ]},
       # you are not going to be able to "pip install" this anyway
       # -- no need for requirements
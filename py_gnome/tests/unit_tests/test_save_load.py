@@ -8,6 +8,8 @@ test functionality of the save_load module used to persist save files
 
 
 import os
+import sys
+import subprocess
 from datetime import datetime
 from zipfile import ZipFile, ZIP_DEFLATED
 
@@ -79,6 +81,22 @@ def test_class_from_objtype():
     assert cls is WindMover
 
 
+def test_class_from_objtype_not_imported():
+    '''
+    class_from_objtype imports the module, so it works whether or not
+    anything else has imported it yet -- run in a fresh interpreter
+    '''
+    code = ("from gnome.gnomeobject import class_from_objtype\n"
+            "cls = class_from_objtype("
+            "'gnome.utilities.projections.FlatEarthProjection')\n"
+            "print(cls.__module__, cls.__name__)\n")
+
+    out = subprocess.check_output([sys.executable, '-c', code])
+
+    assert out.split() == [b'gnome.utilities.projections',
+                           b'FlatEarthProjection']
+
+
 def test_exceptions():
     a = 1
     refs = References()
@@ -0,0 +1,89 @@
+"""
+tests for the lazily loaded names in gnome.scripting
+"""
+
+import os
+import sys
+import ast
+import subprocess
+
+import pytest
+
+import gnome.scripting as gs
+
+
+def test_import_is_light():
+    """
+    importing gnome.scripting and using a time helper should not load the
+    model, the outputters, or netCDF4 -- check in a fresh interpreter
+    """
+    heavy = ['gnome.model', 'gnome.outputters', 'netCDF4']
+    code = ("import sys\n"
+            "import gnome.scripting\n"
+            "gnome.scripting.days(1)\n"
+            "print(' '.join(m for m in {!r} if m in sys.modules))\n"
+            .format(heavy))
+
+    out = subprocess.check_output([sys.executable, '-c', code])
+
+    assert out.split() == []
+
+
+def test_all_names_resolve():
+    for name in gs.__all__:
+        assert getattr(gs, name) is not None
+
+
+def test_lazy_name_cached():
+    model = gs.Model
+
+    assert gs.__dict__['Model'] is model
+    assert gs.Model is model
+    assert 'Model' in gs._RESOLVED
+
+
+def test_lazy_name_is_original():
+    from gnome.outputters import Renderer
+
+    assert gs.Renderer is Renderer
+
+
+def test_dir():
+    assert set(gs.__all__) <= set(dir(gs))
+
+
+def test_missing_name():
+    with pytest.raises(AttributeError):
+        gs.not_a_name
+
+
+def test_warm_up():
+    gs.warm_up(['Renderer', 'WindMover'])
+
+    assert 'Renderer' in gs.__dict__
+    assert 'WindMover' in gs.__dict__
+
+
+def test_warm_up_async():
+    gs.warm_up_async(['NetCDFOutput']).join()
+
+    assert 'NetCDFOutput' in gs.__dict__
+
+
+def test_stub_matches_all():
+    """
+    the .pyi stub should declare every public name
+    """
+    stub = os.path.splitext(gs.__file__)[0] + '.pyi'
+
+    with open(stub) as fh:
+        tree = ast.parse(fh.read())
+
+    names = set()
+    for node in tree.body:
+        if isinstance(node, ast.ImportFrom):
+            names.update(alias.asname for alias in node.names if alias.asname)
+        elif isinstance(node, ast.FunctionDef):
+            names.add(node.name)
+
+    assert names == set(gs.__all__)
@@ -0,0 +1,81 @@
+"""
+tests for the scripting utilities
+"""
+
+import pytest
+
+import gnome.scripting as gs
+import gnome.environment.wind
+from gnome.utilities import remote_data
+
+
+def test_cached_constant_wind():
+    gs.clear_factory_caches()
+
+    w1 = gs.cached_constant_wind(10, 45, 'knots')
+    w2 = gs.cached_constant_wind(10, 45, 'knots')
+    w3 = gs.cached_constant_wind(10, 90, 'knots')
+
+    assert w1 is w2
+    assert w1 is not w3
+    assert w1 == gs.constant_wind(10, 45, 'knots')
+
+
+def test_cached_constant_wind_fp_noise():
+    gs.clear_factory_caches()
+
+    assert (gs.cached_constant_wind(0.1 + 0.2, 45) is
+            gs.cached_constant_wind(0.3, 45))
+
+
+def test_cached_water_unhashable():
+    gs.clear_factory_caches()
+
+    w1 = gs.cached_water(temperature=280, units={'temperature': 'K'})
+    w2 = gs.cached_water(temperature=280, units={'temperature': 'K'})
+
+    assert w1 is not w2
+
+
+def test_cached_factory_type_error(monkeypatch):
+    """
+    a TypeError from the factory itself is raised, not retried uncached
+    """
+    gs.clear_factory_caches()
+    calls = []
+
+    def bad_wind(*args):
+        calls.append(args)
+        raise TypeError('bad argument')
+
+    monkeypatch.setattr(gnome.environment.wind, 'constant_wind', bad_wind)
+
+    with pytest.raises(TypeError):
+        gs.cached_constant_wind(10, 45)
+
+    assert len(calls) == 1
+
+
+def test_clear_factory_caches():
+    w1 = gs.cached_constant_wind_mover(10, 45)
+    gs.clear_factory_caches()
+    w2 = gs.cached_constant_wind_mover(10, 45)
+
+    assert w1 is not w2
+
+
+def test_get_datafile_uses_cache(tmpdir, monkeypatch):
+    """
+    gs.get_datafile uses the data file cache by default
+    """
+    monkeypatch.setenv('GNOME_DATA_CACHE', str(tmpdir.mkdir('cache')))
+
+    url = remote_data.urljoin(remote_data.data_server, 'not_on_server.txt')
+    with open(remote_data._cache_path(url), 'w') as fh:
+        fh.write('cached data')
+
+    filename = str(tmpdir.join('data', 'not_on_server.txt'))
+    assert gs.get_datafile(filename) == filename
+
+    with open(filename) as fh:
+        assert fh.read() == 'cached data'
@@ -12,19 +12,23 @@ in test_spill.py
 
 
 import os
+import math
 from datetime import datetime, timedelta
 
 import pytest
 
 import numpy as np
 
+from gnome.basic_types import world_point_type
 from gnome.spill import (Release,
                          PointLineRelease,
                          SpatialRelease,
-                         #GridRelease,
+                         VerticalPlumeRelease,
+                         GridRelease,
                          )
 from gnome.spill.release import release_from_splot_data
 from gnome.spill.le import LEData
+from gnome.utilities.plume import get_plume_data
 
 
 def test_init():
@@ -40,23 +44,87 @@ class TestRelease(object):
         assert rel.release_time == self.rel_time
         assert rel.release_duration == 0
 
+    def test_release_duration_updates(self):
+        rel = Release(self.rel_time,
+                      end_release_time=self.rel_time + timedelta(hours=2))
+        assert rel.release_duration == 7200
 
-# def test_grid_release():
-#     """
-#     fixme: test something more here? like actually have the release do its thing?
-#     """
-#     bounds = ((0, 10), (2, 12))
-#     release = GridRelease(datetime.now(), bounds, 3)
+        rel.release_time = self.rel_time + timedelta(hours=1)
+        assert rel.release_duration == 3600
+
+        rel.end_release_time = None
+        assert rel.release_duration == 0
+
+    # 4 positions: an exact multiple, remainders, and one of each
+    @pytest.mark.parametrize('to_rel', [4, 8, 10, 11])
+    @pytest.mark.parametrize('order', ['C', 'F'])
+    def test_initialize_LEs_fill(self, to_rel, order):
+        """
+        the in-place fill gives the same positions and masses as the
+        np.tile + np.vstack it replaced, for C-contiguous positions and not
+        """
+        positions = np.array(((0., 0., 0.),
+                              (28.0, -75.0, 0.),
+                              (-15, 12, 4.0),
+                              (80, -80, 100.0)))
+        rel = Release(self.rel_time, num_elements=to_rel,
+                      custom_positions=positions, release_mass=10)
+        rel.prepare_for_model_run(900)
+
+        # what initialize_LEs used to do
+        np.random.seed(42)
+        qt, rem = divmod(to_rel, len(positions))
+        expected = np.vstack((np.tile(positions, (qt, 1)),
+                              positions[np.random.randint(0, len(positions),
+                                                          rem)]))
+
+        # a few elements from an earlier release first
+        data = {'positions': np.full((to_rel + 3, 3), -1.0, order=order),
+                'mass': np.zeros(to_rel + 3),
+                'init_mass': np.zeros(to_rel + 3)}
+
+        np.random.seed(42)
+        rel.initialize_LEs(to_rel, data, self.rel_time, 900)
+
+        assert np.array_equal(data['positions'][3:], expected)
+        assert np.all(data['positions'][:3] == -1)
+        assert np.all(data['mass'][3:] == 10.0 / to_rel)
+        assert np.all(data['init_mass'][3:] == 10.0 / to_rel)
+        assert np.all(data['mass'][:3] == 0)
+
+
+def test_grid_release():
+    bounds = ((0, 10), (2, 12))
+    release = GridRelease(datetime.now(), bounds, 3)
+
+    assert release.num_elements == 9
+    assert np.array_equal(release.custom_positions, [[0., 10., 0.],
+                                                     [1., 10., 0.],
+                                                     [2., 10., 0.],
+                                                     [0., 11., 0.],
+                                                     [1., 11., 0.],
+                                                     [2., 11., 0.],
+                                                     [0., 12., 0.],
+                                                     [1., 12., 0.],
+                                                     [2., 12., 0.]])
+
+
+@pytest.mark.parametrize('resolution', [1, 4, 7])
+def test_grid_release_matches_meshgrid(resolution):
+    """
+    same positions, in the same order, as the meshgrid it replaced
+    """
+    bounds = ((-71.5, 41.2), (-70.25, 42.))
+    release = GridRelease(datetime.now(), bounds, resolution)
+
+    lon = np.linspace(bounds[0][0], bounds[1][0], resolution)
+    lat = np.linspace(bounds[0][1], bounds[1][1], resolution)
+    lon, lat = np.meshgrid(lon, lat)
+    expected = np.c_[lon.flat, lat.flat, np.zeros((resolution * resolution),)]
+
+    assert release.num_elements == resolution * resolution
+    assert np.array_equal(release.custom_positions, expected)
 
-#     assert np.array_equal(release.start_position, [[0., 10., 0.],
-#                                                    [1., 10., 0.],
-#                                                    [2., 10., 0.],
-#                                                    [0., 11., 0.],
-#                                                    [1., 11., 0.],
-#                                                    [2., 11., 0.],
-#                                                    [0., 12., 0.],
-#                                                    [1., 12., 0.],
-#                                                    [2., 12., 0.]])
 
 # todo: add other release to this test - need schemas for all
 rel_time = datetime(2012, 8, 20, 13)
@@ -114,6 +182,18 @@ def r3():
 
 class TestPointLineRelease(object):
 
+    def test_is_pointsource(self, r1, r2):
+        assert not r1.is_pointsource
+
+        r2.end_position = None
+        assert r2.is_pointsource
+
+        r2.end_position = (10, 20, 30)
+        assert not r2.is_pointsource
+
+        r2.start_position = (10, 20, 30)
+        assert r2.is_pointsource
+
     def test_LE_timestep_ratio(self, r1):
         r1.end_release_time = rel_time + timedelta(seconds=1000)*10
         #timestep of 10 seconds. 10,000 second release, min 1000 elements exactly
@@ -126,6 +206,10 @@ class TestPointLineRelease(object):
         assert r1.get_num_release_time_steps(900) == 10
         assert r1.get_num_release_time_steps(899) == 11
 
+        # cached value is dropped when the release time changes
+        r1.end_release_time = rel_time + timedelta(seconds=900) * 20
+        assert r1.get_num_release_time_steps(900) == 20
+
     def test_prepare_for_model_run(self, r1, r2, r3):
         r1.prepare_for_model_run(900)
         assert len(r1._release_ts.data) == 11
@@ -259,6 +343,29 @@ class TestPointLineRelease(object):
                     assert pos[d] >= r._pos_ts.at(None, r.release_time + timedelta(seconds=ts/4))[d]
                     assert pos[d] <= r._pos_ts.at(None, r.release_time + timedelta(seconds=ts/2))[d]
 
+    def test_positions_at(self, r1):
+        r1.prepare_for_model_run(900)
+
+        secs = np.array([-100, 0, 225, 900, 4000, 9000, 20000])
+        pos = r1._positions_at(secs)
+
+        for s, p in zip(secs, pos):
+            expected = r1._pos_ts.at(None, r1.release_time + timedelta(seconds=int(s)),
+                                     extrapolate=True)
+            assert np.allclose(p, expected.reshape(-1))
+
+    def test_num_elements_after_time_matches_ts(self, r1):
+        r1.prepare_for_model_run(900)
+
+        for s in (-100, 0, 225, 450, 900, 1337, 8999, 9000, 20000):
+            t = r1.release_time + timedelta(seconds=s)
+            expected = math.ceil(r1._release_ts.at(None,
+                                                   t + timedelta(seconds=900),
+                                                   extrapolate=True))
+            if s < 0:
+                expected = 0
+            assert r1.num_elements_after_time(t, 900) == expected
+
 from shapely.geometry import Polygon
 custom_positions=np.array([[5,6,7], [8,9,10]])
 polys = [Polygon([[0,0],[0,1],[1,0]])]
@@ -371,3 +478,74 @@ def test_release_from_splot_data():
 
     os.remove(td_file)
 
+
+def _old_plume_elem_coords(rel, current_time, time_step):
+    # the per-element generator expansion VerticalPlumeRelease used to do
+    next_time = current_time + timedelta(seconds=time_step)
+    elem_counts = rel.plume_gen.elems_in_range(current_time, next_time)
+
+    coords = [tuple(c)
+              for coord, count in zip(rel.plume_gen.plume.coords, elem_counts)
+              for c in (coord,) * count]
+
+    return np.asarray(tuple(coords), dtype=world_point_type).reshape((-1, 3))
+
+
+def test_vertical_plume_positions():
+    """
+    the np.repeat expansion gives the same positions as the old
+    per-element one
+    """
+    release_time = datetime(2015, 1, 1)
+    rel = VerticalPlumeRelease(num_elements=200,
+                               start_position=(28, -78, 0.),
+                               release_time=release_time,
+                               end_release_time=release_time + timedelta(hours=4),
+                               plume_data=get_plume_data())
+    time_step = 900
+
+    # through the end of the release, and past it
+    for step in range(18):
+        current_time = release_time + timedelta(seconds=step * time_step)
+        expected = _old_plume_elem_coords(rel, current_time, time_step)
+        num = rel.num_elements_to_release(current_time, time_step)
+
+        assert num == len(expected)
+        assert np.array_equal(rel._plume_elem_coords(current_time, time_step),
+                              expected)
+
+        if num == 0:
+            # the SpillContainer doesn't ask for zero new elements
+            continue
+
+        data_arrays = {'positions': np.zeros((num + 5, 3),
+                                             dtype=world_point_type)}
+        rel.set_newparticle_positions(num, current_time, time_step,
+                                      data_arrays)
+
+        assert np.array_equal(data_arrays['positions'][5:], expected)
+        assert np.all(data_arrays['positions'][:5] == 0)
+
+
+@pytest.mark.parametrize('lines', [
+    # a single splot -- loadtxt gives a 1-d array without ndmin=2
+    ['-7.885776000000000E+01    4.280546000000000E+01   4.4909252E+01'],
+    ['-7.885776000000000E+01    4.280546000000000E+01   4.4909252E+01',
+     '-7.885776000000000E+01    4.279556000000000E+01   2.0000000E+00',
+     '-8.324346000000000E+01    4.196396000000001E+01   3.0546749E+01'],
+])
+def test_release_from_splot_data_rows(tmpdir, lines):
+    td_file = str(tmpdir.join('splots.txt'))
+    with open(td_file, 'w') as td:
+        td.write('\n'.join(lines) + '\n')
+
+    splots = np.array([[float(v) for v in line.split()] for line in lines])
+    counts = splots[:, 2].astype(int)
+    expected = np.zeros((counts.sum(), 3))
+    expected[:, :2] = np.repeat(splots[:, :2], counts, axis=0)
+
+    rel = release_from_splot_data(datetime(2015, 1, 1), td_file)
+
+    assert rel.custom_positions.shape == (counts.sum(), 3)
+    assert rel.custom_positions.dtype == world_point_type
+    assert np.array_equal(rel.custom_positions, expected)
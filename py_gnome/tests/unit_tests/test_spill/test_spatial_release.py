@@ -12,13 +12,17 @@ import datetime
 import numpy as np
 import datetime
 import shapely
+import shapely.ops
+import shapely.affinity
+import geojson
 import pytest
 import zipfile
 import shapefile
 
 from gnome.utilities.geometry import geo_routines
 
-from gnome.spill.release import (SpatialRelease, NESDISRelease)
+from gnome.spill.release import (SpatialRelease, NESDISRelease,
+                                 _parse_nesdis_time)
 
 data_dir = os.path.join(os.path.split(__file__)[0], "data_for_tests")
 
@@ -76,6 +80,38 @@ class TestSpatialRelease(object):
 
         assert all([a == b for a, b in zip(sr.thicknesses, [0.0005, 0.0001])])
 
+    def test_polygons_cached(self):
+        sr = SpatialRelease(filename=sample_shapefile)
+
+        polys = sr.polygons
+        assert sr.polygons is polys
+
+        sr.features = SpatialRelease(polygons=simplePolys).features
+        assert sr.polygons is not polys
+        assert len(sr.polygons) == 2
+        assert sr.polygons[0].equals(simplePolys[0])
+
+    def test_polygons_setter(self):
+        sr = SpatialRelease(polygons=simplePolys)
+        new = [shapely.affinity.translate(p, 1, 1) for p in simplePolys]
+
+        sr.polygons = new
+        assert all(p.equals(n) for p, n in zip(sr.polygons, new))
+        assert all(isinstance(f.geometry, geojson.geometry.Geometry)
+                   for f in sr.features[:])
+
+    def test_get_polygons(self):
+        sr = SpatialRelease(polygons=simplePolys)
+        lengths, polycoords = sr.get_polygons()
+
+        assert lengths.dtype == np.int32
+        polys = geo_routines.mixed_polys_to_polygon(simplePolys)
+        assert len(lengths) == len(polycoords) == len(polys) == 3
+        for l, pc, p in zip(lengths, polycoords, polys):
+            assert pc.dtype == np.float32
+            assert len(pc) == l
+            assert np.allclose(pc, np.array(p.exterior.coords))
+
     def test_serialize(self):
         sr = SpatialRelease(filename=sample_shapefile)
         ser = sr.serialize()
@@ -86,6 +122,40 @@ class TestSpatialRelease(object):
         sr = SpatialRelease(filename=sample_shapefile)
         sr.prepare_for_model_run(900)
 
+    def test_prepare_invalid_coords(self):
+        # e.g. a polygon still in projected coordinates
+        bad = shapely.geometry.Polygon([[0, 0], [300000, 0], [0, 300000]])
+        sr = SpatialRelease(polygons=[simplePolys[0], bad])
+
+        with pytest.raises(ValueError):
+            sr.prepare_for_model_run(900)
+
+    def test_initialize_LEs(self):
+        sr = SpatialRelease(polygons=simplePolys,
+                            release_time=datetime.datetime(2020, 1, 1),
+                            num_elements=1000)
+        sr.prepare_for_model_run(900)
+
+        data = {'positions': np.zeros((1000, 3)),
+                'mass': np.zeros((1000,)),
+                'init_mass': np.zeros((1000,))}
+        sr.initialize_LEs(1000, data, sr.release_time, 900)
+
+        assert np.all(data['positions'][:, 2] == 0)
+
+        region = shapely.ops.unary_union(simplePolys).buffer(1e-9)
+        for x, y, _z in data['positions']:
+            assert region.contains(shapely.geometry.Point(x, y))
+
+    def test_contains_points(self):
+        sr = SpatialRelease(polygons=simplePolys)
+
+        X = np.array([1, 4.5, 0.5, 4.5, 20])
+        Y = np.array([1, 0.5, 4.5, 4.5, 20])
+
+        assert sr.contains_points(X, Y).tolist() == [True, True, True,
+                                                     False, False]
+
     def test_feature_update(self):
         #polygons, weights, and thicknesses can be updated from the web client by passing
         #a new FeatureCollection through the feature attribute.
@@ -132,6 +202,33 @@ class TestNESDISRelease(object):
         assert np.isclose(sum([geo_routines.geo_area_of_polygon(t) for t in sr._tris]),
         sum([geo_routines.geo_area_of_polygon(p) for p in sr.polygons]))
 
+    @pytest.mark.parametrize('im_date, hhmm', [('5/14/2020', '1520'),
+                                                ('05/04/2021', '0920'),
+                                                ('5/14/2020', '920'),
+                                                ('5/14/2020', '123'),
+                                                ])
+    def test_parse_nesdis_time(self, im_date, hhmm):
+        expected = datetime.datetime.strptime(im_date + ' ' + hhmm,
+                                              '%m/%d/%Y %H%M')
+        assert _parse_nesdis_time(im_date, hhmm) == expected
+
+    @pytest.mark.parametrize('im_date, hhmm', [('13/14/2020', '1520'),
+                                                ('5/14/2020', '2460'),
+                                                ('5/14/20', '1520'),
+                                                ])
+    def test_parse_nesdis_time_bad(self, im_date, hhmm):
+        with pytest.raises(ValueError):
+            _parse_nesdis_time(im_date, hhmm)
+
+    def test_oil_types(self):
+        sr = NESDISRelease(filename=sample_shapefile)
+        ot = sr.oil_types
+        assert sr.oil_types is ot
+        assert len(ot) == len(sr.polygons)
+
+        sr.oil_types = ['thick'] * len(ot)
+        assert sr.oil_types == ['thick'] * len(ot)
+
 '''
 def test_load_shapefile():
     (release_time,
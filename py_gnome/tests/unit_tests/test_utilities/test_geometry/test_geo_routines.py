@@ -0,0 +1,187 @@
+"""
+tests for the geo_routines module, part of the geometry package
+
+designed to be run with py.test
+"""
+
+import numpy as np
+import pytest
+
+import geojson
+import pyproj
+
+from shapely.geometry import Polygon, MultiPolygon
+
+from gnome.utilities.geometry import geo_routines
+
+square = Polygon([[0, 0], [3, 0], [3, 3], [0, 3]])
+two_squares = MultiPolygon([Polygon([[4, 0], [5, 0], [5, 1], [4, 1]]),
+                            Polygon([[0, 4], [1, 4], [1, 5], [0, 5]])])
+
+tris = np.array([[[0, 0], [1, 0], [0, 1]],
+                 [[10, 10], [12, 10], [10, 12]]], dtype=np.float64)
+
+
+def test_sample_tris_batch():
+    idx = np.array([1, 0, 1, 1])
+    r1 = np.zeros(4)  # all at the first vertex
+    r2 = np.random.random(4)
+    out = np.full((4, 3), -1.0)
+
+    geo_routines.sample_tris_batch(tris, idx, r1, r2, out)
+
+    assert np.all(out[:, :2] == tris[idx, 0])
+    # only the first two columns are written
+    assert np.all(out[:, 2] == -1)
+
+
+@pytest.mark.parametrize('sampler', ['_sample_tris_numpy',
+                                     '_sample_tris_cython'])
+def test_samplers_match(sampler):
+    if (sampler == '_sample_tris_cython' and
+            geo_routines._cy_sample_tris is None):
+        pytest.skip('cy_sample_tris extension not built')
+
+    idx = np.random.randint(0, 2, 20)
+    r1 = np.random.random(20)
+    r2 = np.random.random(20)
+    expected = np.zeros((20, 2))
+    out = np.zeros((20, 2))
+
+    geo_routines._sample_tris_loop(tris, idx, r1, r2, expected)
+    getattr(geo_routines, sampler)(tris, idx, r1, r2, out)
+
+    assert np.allclose(out, expected)
+
+
+def test_sample_tris_batch_numba(monkeypatch):
+    """
+    batches of numba_min_batch or more go to the numba kernel
+    """
+    pytest.importorskip('numba')
+
+    kernel = geo_routines._numba_sample_tris()
+    calls = []
+
+    def spy(*args):
+        calls.append(len(args[1]))
+        kernel(*args)
+
+    monkeypatch.setattr(geo_routines, '_numba_sample_tris', lambda: spy)
+    monkeypatch.setattr(geo_routines, 'numba_min_batch', 20)
+
+    idx = np.random.randint(0, 2, 20)
+    r1 = np.random.random(20)
+    r2 = np.random.random(20)
+    expected = np.zeros((20, 2))
+    out = np.zeros((20, 2))
+
+    geo_routines._sample_tris_numpy(tris, idx, r1, r2, expected)
+    geo_routines.sample_tris_batch(tris, idx, r1, r2, out)
+    # too small for numba
+    geo_routines.sample_tris_batch(tris, idx[:10], r1[:10], r2[:10],
+                                   np.zeros((10, 2)))
+
+    assert calls == [20]
+    assert np.allclose(out, expected)
+    # the kernel is built in its own scope, not by patching the module
+    assert not hasattr(geo_routines, 'prange')
+
+
+def test_shapes_from_geojson():
+    holey = Polygon([[0, 0], [3, 0], [3, 3], [0, 3]],
+                    [[[1, 1], [2, 1], [2, 2]]])
+    shapes = [square, holey, two_squares, square]
+    geoms = [geojson.loads(geojson.dumps(s.__geo_interface__)) for s in shapes]
+
+    result = geo_routines.shapes_from_geojson(geoms)
+
+    assert len(result) == len(shapes)
+    for r, s in zip(result, shapes):
+        assert r.geom_type == s.geom_type
+        assert r.equals(s)
+
+
+def test_check_valid_polygons():
+    geo_routines.check_valid_polygons([square, two_squares])
+
+    bad = Polygon([[0, 0], [0, 100], [1, 0]])
+    with pytest.raises(ValueError):
+        geo_routines.check_valid_polygons([square, bad])
+    # what check_valid_polygon raises
+    with pytest.raises(AssertionError):
+        geo_routines.check_valid_polygons([square, bad])
+    with pytest.raises(AssertionError):
+        geo_routines.check_valid_polygon(bad)
+
+
+def test_check_valid_polygons_exterior_only():
+    # only the exterior ring is checked, as in check_valid_polygon
+    odd_hole = Polygon([[0, 0], [3, 0], [3, 3], [0, 3]],
+                       [[[1, 1], [2, 1], [2, 100]]])
+
+    geo_routines.check_valid_polygon(odd_hole)
+    geo_routines.check_valid_polygons([square, odd_hole, two_squares])
+
+
+def test_bbox_prefilter_contains():
+    pts = np.array([[1, 1],      # in square
+                    [4.5, 0.5],  # in two_squares
+                    [4.5, 4.5],  # in the bounding box of two_squares only
+                    [20, 20]])   # nowhere
+
+    result = geo_routines.bbox_prefilter_contains(pts, [square, two_squares])
+
+    assert result.tolist() == [[True, False],
+                               [False, True],
+                               [False, False],
+                               [False, False]]
+
+
+def test_lonlat_transformer():
+    t = geo_routines.lonlat_transformer(3857)
+    assert geo_routines.lonlat_transformer(3857) is t
+
+    lon, lat = t.transform(0, 0)
+    assert np.isclose(lon, 0) and np.isclose(lat, 0)
+
+
+def test_transform_geometries():
+    t = geo_routines.lonlat_transformer(3857)
+    geoms = [Polygon([[0, 0], [1e5, 0], [1e5, 1e5]]),
+             MultiPolygon([Polygon([[4e5, 0], [5e5, 0], [5e5, 1e5]]),
+                           Polygon([[6e5, 0], [7e5, 0], [7e5, 1e5]])])]
+
+    result = geo_routines.transform_geometries(geoms, t)
+
+    assert len(result) == 2
+    for r, g in zip(result, geoms):
+        assert r.geom_type == g.geom_type
+        x, y = t.transform(*np.array(g.exterior.coords
+                                     if g.geom_type == 'Polygon'
+                                     else g.geoms[0].exterior.coords).T)
+        first = r if r.geom_type == 'Polygon' else r.geoms[0]
+        assert np.allclose(np.array(first.exterior.coords), np.c_[x, y])
+
+
+def test_is_lonlat_crs():
+    esri_wgs84 = ('GEOGCS["GCS_WGS_1984",DATUM["D_WGS_1984",'
+                  'SPHEROID["WGS_1984",6378137.0,298.257223563]],'
+                  'PRIMEM["Greenwich",0.0],'
+                  'UNIT["Degree",0.0174532925199433]]')
+
+    assert geo_routines.is_lonlat_crs(pyproj.CRS.from_epsg(4326))
+    assert geo_routines.is_lonlat_crs(pyproj.CRS.from_wkt(esri_wgs84))
+    assert not geo_routines.is_lonlat_crs(pyproj.CRS.from_epsg(3857))
+
+
+def test_transform_xy_chunked():
+    t = geo_routines.lonlat_transformer(3857)
+    x = np.random.uniform(-1e7, 1e7, 1001)
+    y = np.random.uniform(-1e7, 1e7, 1001)
+
+    expected = t.transform(x, y)
+    result = geo_routines.transform_xy(t, x, y, chunk_size=100, max_workers=4)
+
+    assert np.array_equal(result[0], expected[0])
+    assert np.array_equal(result[1], expected[1])
@@ -11,7 +11,8 @@ Test gnome.utilities.rand.py
 import numpy as np
 import random
 
-from gnome.utilities.rand import random_with_persistance, seed
+from gnome.utilities.rand import (random_with_persistance, seed,
+                                  build_alias_table, alias_sample)
 from gnome.cy_gnome.cy_helpers import rand
 
 import pytest
@@ -95,3 +96,22 @@ def test_set_seed():
     assert xi == xf
     assert np.all(ai == af)
     assert ci == cf
+
+
+@pytest.mark.parametrize("weights", [[1.0],
+                                     [0.5, 0.5],
+                                     [0.1, 0.0, 0.6, 0.3],
+                                     [2, 1, 1],  # not normalized
+                                     ])
+def test_alias_sample(weights):
+    seed(1)
+
+    prob, alias = build_alias_table(weights)
+    idx = alias_sample(prob, alias, 100000)
+
+    expected = np.asarray(weights, dtype=np.float64) / np.sum(weights)
+    counts = np.bincount(idx, minlength=len(weights)) / 100000.
+
+    assert np.allclose(counts, expected, atol=0.01)
+    # zero weights are never picked
+    assert np.all(counts[expected == 0] == 0)
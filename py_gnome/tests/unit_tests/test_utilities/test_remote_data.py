@@ -8,6 +8,7 @@ test functions in remote_data module
 
 import os
 import shutil
+import socket
 
 try:  # the py3 way
     from urllib.error import HTTPError, URLError
@@ -15,6 +16,7 @@ except ImportError:  # the py2 way
     from urllib2 import HTTPError, URLError
 
 
+from gnome.utilities import remote_data
 from gnome.utilities.remote_data import get_datafile
 
 import pytest
@@ -71,3 +73,161 @@ def test_get_datafile():
     # do not delete file_
     if renamed is not None:
         shutil.move(renamed, file_)
+
+
+def test_get_datafile_from_cache(tmpdir, monkeypatch):
+    """
+    a file in the download cache is used without going to the server
+    """
+    monkeypatch.setenv('GNOME_DATA_CACHE', str(tmpdir.mkdir('cache')))
+
+    url = remote_data.urljoin(remote_data.data_server, 'not_on_server.txt')
+    with open(remote_data._cache_path(url), 'w') as fh:
+        fh.write('cached data')
+
+    filename = str(tmpdir.join('data', 'not_on_server.txt'))
+    assert get_datafile(filename, cache='if-missing') == filename
+
+    with open(filename) as fh:
+        assert fh.read() == 'cached data'
+
+
+def test_get_datafile_no_cache_by_default(tmpdir, monkeypatch):
+    """
+    without a cache option, the cache is not looked at
+    """
+    monkeypatch.setenv('GNOME_DATA_CACHE', str(tmpdir.mkdir('cache')))
+
+    def offline(url):
+        raise URLError('offline')
+
+    monkeypatch.setattr(remote_data, 'urlopen', offline)
+
+    url = remote_data.urljoin(remote_data.data_server, 'not_on_server.txt')
+    with open(remote_data._cache_path(url), 'w') as fh:
+        fh.write('cached data')
+
+    with pytest.raises(URLError):
+        get_datafile(str(tmpdir.join('data', 'not_on_server.txt')))
+
+
+def test_clear_datafile_cache(tmpdir, monkeypatch):
+    cache_dir = str(tmpdir.join('cache'))
+    monkeypatch.setenv('GNOME_DATA_CACHE', cache_dir)
+
+    url = remote_data.urljoin(remote_data.data_server, 'not_on_server.txt')
+    os.makedirs(cache_dir)
+    with open(remote_data._cache_path(url), 'w') as fh:
+        fh.write('cached data')
+
+    remote_data.clear_datafile_cache()
+
+    assert not os.path.exists(cache_dir)
+
+
+@pytest.mark.parametrize('cache', ['sometimes', 3600])
+def test_get_datafile_bad_cache_option(tmpdir, cache):
+    with pytest.raises(ValueError):
+        get_datafile(str(tmpdir.join('not_on_server.txt')), cache=cache)
+
+
+@pytest.mark.parametrize('can_link', [True, False])
+def test_from_cache_link_or_copy(tmpdir, monkeypatch, can_link):
+    """
+    a cache hit hard links the cached file if it can, copies it if not
+    """
+    monkeypatch.setenv('GNOME_DATA_CACHE', str(tmpdir.mkdir('cache')))
+
+    if not can_link:
+        def no_link(src, dst):
+            raise OSError('no hard links here')
+
+        monkeypatch.setattr(remote_data.os, 'link', no_link)
+
+    url = remote_data.urljoin(remote_data.data_server, 'not_on_server.txt')
+    downloaded = str(tmpdir.join('downloaded.txt'))
+    with open(downloaded, 'w') as fh:
+        fh.write('cached data')
+    remote_data._to_cache(url, downloaded, {})
+
+    filename = str(tmpdir.join('not_on_server.txt'))
+    assert remote_data._from_cache(url, filename)
+
+    with open(filename) as fh:
+        assert fh.read() == 'cached data'
+
+    linked = os.path.samefile(filename, remote_data._cache_path(url))
+    assert linked is can_link
+
+
+class _HeadResponse(object):
+    def __init__(self, headers):
+        self.headers = headers
+
+    def info(self):
+        return self.headers
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        pass
+
+
+@pytest.mark.parametrize(('etag', 'expected'), [('"abc"', True),
+                                                ('"def"', False)])
+def test_from_cache_revalidate(tmpdir, monkeypatch, etag, expected):
+    """
+    with revalidate, the cached file is only used if its ETag still
+    matches the server's
+    """
+    monkeypatch.setenv('GNOME_DATA_CACHE', str(tmpdir.mkdir('cache')))
+    monkeypatch.setattr(remote_data, 'urlopen',
+                        lambda req, timeout: _HeadResponse({'ETag': etag}))
+
+    url = remote_data.urljoin(remote_data.data_server, 'not_on_server.txt')
+    downloaded = str(tmpdir.join('downloaded.txt'))
+    with open(downloaded, 'w') as fh:
+        fh.write('cached data')
+    remote_data._to_cache(url, downloaded, {'ETag': '"abc"'})
+
+    filename = str(tmpdir.join('not_on_server.txt'))
+    assert remote_data._from_cache(url, filename,
+                                   revalidate=True) is expected
+    assert os.path.exists(filename) is expected
+
+
+def test_from_cache_revalidate_timeout(tmpdir, monkeypatch):
+    """
+    a server that doesn't answer the HEAD request means the cached file
+    can't be revalidated
+    """
+    monkeypatch.setenv('GNOME_DATA_CACHE', str(tmpdir.mkdir('cache')))
+
+    def no_answer(req, timeout):
+        raise socket.timeout('timed out')
+
+    monkeypatch.setattr(remote_data, 'urlopen', no_answer)
+
+    url = remote_data.urljoin(remote_data.data_server, 'not_on_server.txt')
+    downloaded = str(tmpdir.join('downloaded.txt'))
+    with open(downloaded, 'w') as fh:
+        fh.write('cached data')
+    remote_data._to_cache(url, downloaded, {'ETag': '"abc"'})
+
+    assert not remote_data._from_cache(url, str(tmpdir.join('out.txt')),
+                                       revalidate=True)
+
+
+def test_to_cache_no_temp_files(tmpdir, monkeypatch):
+    cache_dir = tmpdir.mkdir('cache')
+    monkeypatch.setenv('GNOME_DATA_CACHE', str(cache_dir))
+
+    url = remote_data.urljoin(remote_data.data_server, 'not_on_server.txt')
+    downloaded = str(tmpdir.join('downloaded.txt'))
+    with open(downloaded, 'w') as fh:
+        fh.write('cached data')
+    remote_data._to_cache(url, downloaded, {})
+
+    key = os.path.basename(remote_data._cache_path(url))
+    assert sorted(os.listdir(str(cache_dir))) == [key, key + '.meta']
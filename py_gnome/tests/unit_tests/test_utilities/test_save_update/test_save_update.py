@@ -14,6 +14,7 @@ from gnome.utilities.save_updater import (extract_zipfile,
                                           update_savefile,
                                           remember_cwd,
                                           v0tov1,
+                                          load_json,
                                           )
 
 '''
@@ -96,3 +97,22 @@ def test_v0_to_v1():
             lambda js: 'gnome.spill.substance.GnomeOil' in js['obj_type'] and
                 js.get('name', None) == "*GENERIC DIESEL"
         )
+
+
+@pytest.mark.parametrize('text, expected', [('{"a": [1, 2.5, "b"]}',
+                                             {'a': [1, 2.5, 'b']}),
+                                            ('{"a": NaN}', None),
+                                            ])
+def test_load_json(text, expected):
+    with tempfile.TemporaryDirectory() as tempdir:
+        fname = os.path.join(tempdir, 'obj.json')
+        with open(fname, 'w') as fp:
+            fp.write(text)
+
+        result = load_json(fname)
+
+    if expected is None:
+        # NaN is valid for json, but not orjson
+        assert result['a'] != result['a']
+    else:
+        assert result == expected